@@ -9,6 +9,18 @@ from pathlib import Path
 from typing import Optional
 
 
+def prettify_id(id_string: str) -> str:
+    """Convert an ID string to a human-readable label.
+    
+    Args:
+        id_string: ID string with underscores (e.g., "mining_facility")
+        
+    Returns:
+        Prettified string (e.g., "Mining Facility")
+    """
+    return id_string.replace('_', ' ').title()
+
+
 class DataLoader:
     """Loads and caches JSON game data from /data/ directory.
     
@@ -20,6 +32,7 @@ class DataLoader:
         """Initialize the data loader."""
         self._goods = None
         self._facility_categories = None
+        self._facility_labels = None
         self._population_levels = None
         self._data_dir = None
         
@@ -81,6 +94,7 @@ class DataLoader:
         """
         self.get_goods()
         self.get_facility_categories()
+        self.get_facility_labels()
         self.get_population_levels()
     
     def get_goods(self) -> list[dict]:
@@ -106,6 +120,22 @@ class DataLoader:
             self._facility_categories = data.get("categories", {})
         return self._facility_categories
     
+    def get_facility_labels(self) -> dict[str, str]:
+        """Get display labels for facility categories and facility IDs.
+        
+        Returns:
+            Dictionary mapping category names and facility IDs to prettified labels.
+            Example: {"industry": "Industry", "mining_facility": "Mining Facility", ...}
+        """
+        if self._facility_labels is None:
+            labels = {}
+            for category_name, facility_ids in self.get_facility_categories().items():
+                labels[category_name] = prettify_id(category_name)
+                for facility_id in facility_ids:
+                    labels[facility_id] = prettify_id(facility_id)
+            self._facility_labels = labels
+        return self._facility_labels
+    
     def get_population_levels(self) -> list[dict]:
         """Get the list of population levels.
         
@@ -4,9 +4,10 @@ This module contains all PySide6 UI components including the main window,
 map view, and workspace controls.
 """
 
+import math
 import sys
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List, Sequence
 
 # Add current directory to path for core imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -15,18 +16,28 @@ from PySide6.QtWidgets import (
     QMainWindow, QGraphicsView, QGraphicsScene,
     QPushButton, QHBoxLayout, QVBoxLayout, QWidget, QFileDialog, 
     QMessageBox, QLabel, QSlider, QToolBar, QMenuBar, QMenu,
-    QGraphicsPathItem, QInputDialog, QGraphicsTextItem, QListWidget,
+    QGraphicsItem, QGraphicsPathItem, QInputDialog, QGraphicsTextItem, QListWidget,
     QDialog, QDialogButtonBox, QComboBox, QSplitter, QTabWidget,
-    QCheckBox, QSpinBox, QDoubleSpinBox, QRadioButton, QButtonGroup, QFormLayout
+    QCheckBox, QSpinBox, QDoubleSpinBox, QRadioButton, QButtonGroup, QFormLayout,
+    QListView
 )
-from PySide6.QtCore import Qt, QTimer, QPointF, Signal
-from PySide6.QtGui import QPixmap, QPen, QColor, QPainter, QKeyEvent, QWheelEvent, QAction, QPainterPath, QFont
+from PySide6.QtCore import (
+    Qt, QEvent, QElapsedTimer, QTimer, QVariantAnimation, QPointF, QLineF,
+    QSize, QSortFilterProxyModel, Signal
+)
+from PySide6.QtGui import (
+    QPixmap, QPen, QColor, QPainter, QKeyEvent, QMouseEvent, QWheelEvent, QAction, QPainterPath, QFont,
+    QStandardItem, QStandardItemModel, QSurfaceFormat, QImage
+)
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
 from core import (
     MapProject, TemplateData, SystemData, SystemItem, 
     SystemDialog, TemplateItem, RouteData, RouteItem
 )
 from core.project_model import RouteGroup
+from core.systems import intern_ids
+from core.templates import TemplateImageLoader
 from core.project_io import save_project, load_project, export_map_data
 
 
@@ -52,6 +63,46 @@ class GridOverlay(QGraphicsScene):
         self.show_grid = False
         self.major_grid_interval = 5  # Draw major grid lines every N cells (for low zoom levels)
         
+        # Grid lines built for a region around the last exposed rect, reused
+        # for every repaint that falls inside it (see _grid_lines_for)
+        self._grid_region = None  # (left, top, right, bottom, spacing) in HSU
+        self._grid_lines: List[QLineF] = []
+        self._grid_pen = None  # Cosmetic pen for the current grid_color
+        
+    def _grid_lines_for(self, rect) -> List[QLineF]:
+        """Get grid lines covering a rect, rebuilding them only when needed.
+        
+        On a miss, lines are built for the rect grown by its own size on
+        every side and snapped to grid cells, so repaints while panning or
+        dragging items mostly reuse them.
+        
+        Args:
+            rect: Rectangle in scene coordinates that must be covered
+        """
+        spacing = self.grid_spacing
+        region = self._grid_region
+        if (region is not None and region[4] == spacing and
+                region[0] <= rect.left() and region[1] <= rect.top() and
+                region[2] >= rect.right() and region[3] >= rect.bottom()):
+            return self._grid_lines
+        
+        # WORLD SPACE: Snap the grown rect outwards to grid lines (HSU)
+        w, h = rect.width(), rect.height()
+        first_col = math.floor((rect.left() - w) / spacing)
+        first_row = math.floor((rect.top() - h) / spacing)
+        last_col = math.ceil((rect.right() + w) / spacing)
+        last_row = math.ceil((rect.bottom() + h) / spacing)
+        left, top = first_col * spacing, first_row * spacing
+        right, bottom = last_col * spacing, last_row * spacing
+        
+        lines = [QLineF(col * spacing, top, col * spacing, bottom)
+                 for col in range(first_col, last_col + 1)]
+        lines += [QLineF(left, row * spacing, right, row * spacing)
+                  for row in range(first_row, last_row + 1)]
+        self._grid_region = (left, top, right, bottom, spacing)
+        self._grid_lines = lines
+        return lines
+    
     def drawForeground(self, painter, rect):
         """Draw infinite grid overlay on top of scene items.
         
@@ -68,26 +119,12 @@ class GridOverlay(QGraphicsScene):
         painter.save()
         
         # UI SPACE: Grid line thickness (1 pixel regardless of zoom)
-        painter.setPen(QPen(self.grid_color, 0))  # 0 = cosmetic pen (always 1px)
-        
-        # WORLD SPACE: Calculate grid bounds from visible rect
-        # Extend beyond visible area to ensure complete coverage
-        left = int(rect.left() / self.grid_spacing) * self.grid_spacing
-        top = int(rect.top() / self.grid_spacing) * self.grid_spacing
-        right = rect.right()
-        bottom = rect.bottom()
-        
-        # Draw vertical lines (WORLD SPACE: HSU coordinates)
-        x = left
-        while x <= right:
-            painter.drawLine(int(x), int(top), int(x), int(bottom))
-            x += self.grid_spacing
-            
-        # Draw horizontal lines (WORLD SPACE: HSU coordinates)
-        y = top
-        while y <= bottom:
-            painter.drawLine(int(left), int(y), int(right), int(y))
-            y += self.grid_spacing
+        if self._grid_pen is None or self._grid_pen.color() != self.grid_color:
+            self._grid_pen = QPen(self.grid_color, 0)  # 0 = cosmetic pen (always 1px)
+        painter.setPen(self._grid_pen)
+        
+        # All lines in one call; the painter clips them to the exposed rect
+        painter.drawLines(self._grid_lines_for(rect))
             
         painter.restore()
 
@@ -134,9 +171,26 @@ class MapView(QGraphicsView):
     # Signals for route editing context menus
     system_context_menu_requested = Signal(object, object)  # (SystemItem, global_pos)
     segment_context_menu_requested = Signal(object, object, object)  # (RouteItem, segment_info, global_pos)
+
+    # Navigation keys as bits of keys_pressed; each key has its own bit so
+    # releasing Up does not cancel a held W
+    _KEY_BITS = {
+        Qt.Key_W: 1, Qt.Key_S: 2, Qt.Key_A: 4, Qt.Key_D: 8,
+        Qt.Key_Up: 16, Qt.Key_Down: 32, Qt.Key_Left: 64, Qt.Key_Right: 128,
+    }
+    _PAN_UP = 1 | 16
+    _PAN_DOWN = 2 | 32
+    _PAN_LEFT = 4 | 64
+    _PAN_RIGHT = 8 | 128
     
+    PAN_FRAME_MS = 33  # pan_speed is the distance moved per this many ms
+    INTERACTION_SETTLE_MS = 150  # Antialiasing returns this long after motion stops
+
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
+        # The scrollbars live as long as the view; bind them once for panning
+        self._hbar = self.horizontalScrollBar()
+        self._vbar = self.verticalScrollBar()
         self.setRenderHint(QPainter.Antialiasing)
         self.setRenderHint(QPainter.SmoothPixmapTransform)
         self.setDragMode(QGraphicsView.NoDrag)
@@ -149,20 +203,41 @@ class MapView(QGraphicsView):
         self.max_zoom = 10.0  # Maximum zoom level (1000%)
         self.current_zoom = 1.0  # Current zoom level tracking
         
+        # Wheel zoom steps are accumulated and applied once per frame
+        self._wheel_steps = 0  # Net zoom steps (+1 in, -1 out) not yet applied
+        self._wheel_pos = None  # Viewport position of the latest wheel event
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(16)  # ~60 FPS
+        self._wheel_timer.timeout.connect(self._apply_wheel_zoom)
+        
         # Template scaling configuration
         self.template_scale_base_factor = 0.1  # Base scale change per wheel tick
         
         # Panning configuration
-        self.pan_speed = 15  # Base pan speed in pixels
+        self.pan_speed = 15  # Base pan speed in pixels per PAN_FRAME_MS
         self.pan_sensitivity = 1.0  # Pan sensitivity multiplier
-        self.keys_pressed = set()  # Currently pressed navigation keys
-        self.pan_timer = QTimer(self)
-        self.pan_timer.timeout.connect(self._handle_continuous_pan)
-        self.pan_timer.setInterval(33)  # ~30 FPS for smooth panning
-        
-        # Mouse panning state
-        self.is_panning = False
-        self.pan_start_pos = None
+        self.keys_pressed = 0  # Bitmask of pressed navigation keys, see _KEY_BITS
+        # An endless animation drives key panning, so steps follow Qt's
+        # animation clock (one per rendered frame) instead of a fixed timer
+        self.pan_animation = QVariantAnimation(self)
+        self.pan_animation.setStartValue(0.0)
+        self.pan_animation.setEndValue(1.0)
+        self.pan_animation.setDuration(1000)
+        self.pan_animation.setLoopCount(-1)
+        self.pan_animation.valueChanged.connect(self._handle_continuous_pan)
+        self._pan_clock = QElapsedTimer()  # Time since the previous pan step
+        self._pan_carry = 0.0  # Sub-pixel pan distance not yet applied
+        
+        # Mouse panning state (the drag itself is Qt's ScrollHandDrag)
+        self.is_panning = False  # A hand-drag pan is in progress
+        
+        # Antialiasing is switched off while the view pans or zooms
+        self._interacting = False
+        self._interaction_timer = QTimer(self)
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.setInterval(self.INTERACTION_SETTLE_MS)
+        self._interaction_timer.timeout.connect(self._finish_interaction)
         self.space_pressed = False
         
         # Mode state
@@ -180,6 +255,7 @@ class MapView(QGraphicsView):
         # Route drawing state (click-to-add polyline)
         self.route_drawing_active = False
         self.route_drawing_start_system_id: Optional[str] = None
+        self.route_drawing_start_pos: Optional[QPointF] = None  # Start system position (HSU)
         self.route_drawing_points: List[QPointF] = []  # Intermediate vertices
         self.route_drawing_preview_item: Optional[QGraphicsPathItem] = None  # Visual preview during drawing
         
@@ -198,6 +274,31 @@ class MapView(QGraphicsView):
         self.zoom_indicator.setAlignment(Qt.AlignLeft)
         self.update_zoom_indicator()
 
+    def set_opengl_enabled(self, enabled: bool):
+        """Render the view through OpenGL or the default raster widget.
+        
+        OpenGL moves rasterization, antialiasing and transforms to the GPU,
+        which helps on large maps; text may render slightly differently.
+        
+        Args:
+            enabled: True for an OpenGL viewport, False for the raster one
+        """
+        if enabled == isinstance(self.viewport(), QOpenGLWidget):
+            return
+        if enabled:
+            viewport = QOpenGLWidget()
+            surface_format = QSurfaceFormat()
+            surface_format.setSamples(4)  # Multisample antialiasing
+            viewport.setFormat(surface_format)
+            self.setViewport(viewport)
+            # An OpenGL frame is always redrawn as a whole
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewport(QWidget())
+            self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        # The new viewport is stacked above the existing overlay widgets
+        self.zoom_indicator.raise_()
+    
     def wheelEvent(self, event: QWheelEvent):
         """Handle mouse wheel for zooming or template scaling.
         
@@ -227,48 +328,70 @@ class MapView(QGraphicsView):
                 event.accept()
                 return
         
-        # Normal view zoom
-        # Calculate zoom factor
-        if event.angleDelta().y() > 0:
-            zoom = self.zoom_factor
-        else:
-            zoom = 1.0 / self.zoom_factor
+        # Normal view zoom: one step per event, applied by _apply_wheel_zoom
+        # so that bursts of events (e.g. from trackpads) cost one transform
+        self._wheel_steps += 1 if event.angleDelta().y() > 0 else -1
+        self._wheel_pos = event.position().toPoint()
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
+        event.accept()
+    
+    def _apply_wheel_zoom(self):
+        """Apply the accumulated wheel zoom steps, centered on the cursor."""
+        steps = self._wheel_steps
+        self._wheel_steps = 0
+        if steps == 0:
+            return
         
-        # Check zoom limits
-        new_zoom = self.current_zoom * zoom
-        if new_zoom < self.min_zoom or new_zoom > self.max_zoom:
+        # Take steps until the next one would leave the zoom limits
+        step = self.zoom_factor if steps > 0 else 1.0 / self.zoom_factor
+        new_zoom = self.current_zoom
+        for _ in range(abs(steps)):
+            if not self.min_zoom <= new_zoom * step <= self.max_zoom:
+                break
+            new_zoom *= step
+        if new_zoom == self.current_zoom:
             return
+        zoom = new_zoom / self.current_zoom
+        self._begin_interaction()
         
         # Get the position of the mouse in scene coordinates before zoom
-        old_pos = self.mapToScene(event.position().toPoint())
+        old_pos = self.mapToScene(self._wheel_pos)
         
         # Apply zoom (VIEW SPACE: only affects how many pixels per HSU)
         self.scale(zoom, zoom)
         self.current_zoom = new_zoom
         
         # Get the new position of the mouse in scene coordinates after zoom
-        new_pos = self.mapToScene(event.position().toPoint())
+        new_pos = self.mapToScene(self._wheel_pos)
         
         # Calculate the difference and adjust view to keep it under the mouse
         delta = new_pos - old_pos
         self.translate(delta.x(), delta.y())
         
-        # Update zoom indicator
+        # Update zoom indicator (the transform change repaints the viewport)
         self.update_zoom_indicator()
-        
-        # Update the scene to refresh grid
-        self.scene().update()
+        self._end_interaction()
         
     def keyPressEvent(self, event: QKeyEvent):
         """Handle key press for continuous WASD/Arrow panning, Space for mouse pan, and ESC for cancel."""
-        if event.key() in (Qt.Key_W, Qt.Key_S, Qt.Key_A, Qt.Key_D,
-                          Qt.Key_Up, Qt.Key_Down, Qt.Key_Left, Qt.Key_Right):
-            self.keys_pressed.add(event.key())
-            if not self.pan_timer.isActive():
-                self.pan_timer.start()
+        bit = self._KEY_BITS.get(event.key())
+        if bit is not None:
+            if event.isAutoRepeat():
+                # Held key; the pan animation is already running
+                event.accept()
+                return
+            if not self.keys_pressed:
+                self._pan_clock.start()
+                self._pan_carry = 0.0
+                self.pan_animation.start()
+                self._begin_interaction()
+            self.keys_pressed |= bit
             event.accept()
         elif event.key() == Qt.Key_Space:
-            self.space_pressed = True
+            if not event.isAutoRepeat():
+                self.space_pressed = True
+                self._set_hand_pan(True)
             event.accept()
         elif event.key() == Qt.Key_Escape:
             # Cancel route drawing if active
@@ -282,24 +405,86 @@ class MapView(QGraphicsView):
     
     def keyReleaseEvent(self, event: QKeyEvent):
         """Handle key release to stop continuous panning."""
-        if event.key() in (Qt.Key_W, Qt.Key_S, Qt.Key_A, Qt.Key_D,
-                          Qt.Key_Up, Qt.Key_Down, Qt.Key_Left, Qt.Key_Right):
-            self.keys_pressed.discard(event.key())
+        bit = self._KEY_BITS.get(event.key())
+        if bit is not None:
+            if event.isAutoRepeat():
+                # Auto-repeat sends a release before each repeated press;
+                # keep panning instead of restarting the animation and clock
+                event.accept()
+                return
+            self.keys_pressed &= ~bit
             if not self.keys_pressed:
-                self.pan_timer.stop()
+                self.pan_animation.stop()
+                self._end_interaction()
             event.accept()
         elif event.key() == Qt.Key_Space:
-            self.space_pressed = False
-            if self.is_panning:
-                self.is_panning = False
-                self.setCursor(Qt.ArrowCursor)
+            if not event.isAutoRepeat():
+                self.space_pressed = False
+                # A pan in progress ends on mouse release instead
+                if not self.is_panning:
+                    self._set_hand_pan(False)
             event.accept()
         else:
             super().keyReleaseEvent(event)
     
-    def _handle_continuous_pan(self):
-        """Handle continuous panning based on pressed keys."""
-        if not self.keys_pressed:
+    def _begin_interaction(self):
+        """Turn antialiasing off while the view is moving.
+        
+        Pan and zoom frames repaint large areas; rendering them without
+        antialiasing keeps them fast. Cached items re-rendered meanwhile
+        (after a zoom, or when first exposed) are refreshed by
+        _finish_interaction().
+        """
+        self._interaction_timer.stop()
+        if not self._interacting:
+            self._interacting = True
+            self.setRenderHint(QPainter.Antialiasing, False)
+            self.setRenderHint(QPainter.SmoothPixmapTransform, False)
+    
+    def _end_interaction(self):
+        """Restore antialiasing once the view has been still for a moment."""
+        self._interaction_timer.start()
+    
+    def _finish_interaction(self):
+        """Restore the render hints unless another pan is still running."""
+        if self.keys_pressed or self.is_panning:
+            return
+        self._interacting = False
+        # setRenderHint repaints the viewport with the restored hints
+        self.setRenderHint(QPainter.Antialiasing, True)
+        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        # but cached items would blit the pixmaps they rendered without
+        # antialiasing during the interaction; make them render again
+        no_cache = QGraphicsItem.NoCache
+        for item in self.scene().items():
+            if item.cacheMode() != no_cache:
+                item.update()
+    
+    def _set_hand_pan(self, enabled: bool):
+        """Switch Qt's built-in hand-drag panning on or off.
+        
+        Scene interaction is disabled while it is on, so dragging over a
+        system pans the view instead of moving the system.
+        """
+        self.setInteractive(not enabled)
+        self.setDragMode(QGraphicsView.ScrollHandDrag if enabled else QGraphicsView.NoDrag)
+    
+    @staticmethod
+    def _as_left_button(event) -> QMouseEvent:
+        """Copy a mouse event as a left-button event (ScrollHandDrag only pans on left)."""
+        buttons = Qt.NoButton if event.type() == QEvent.MouseButtonRelease else Qt.LeftButton
+        return QMouseEvent(event.type(), event.position(), event.scenePosition(),
+                           event.globalPosition(), Qt.LeftButton, buttons, event.modifiers())
+    
+    def _handle_continuous_pan(self, _value=None):
+        """Handle continuous panning based on pressed keys.
+        
+        Called on every pan_animation frame; the distance moved is scaled by
+        the time since the previous frame, so the pan speed does not depend
+        on the frame rate.
+        """
+        keys = self.keys_pressed
+        if not keys:
             return
         
         # Calculate pan speed scaled by zoom level and pan sensitivity
@@ -307,28 +492,18 @@ class MapView(QGraphicsView):
         safe_zoom = max(self.current_zoom, self.min_zoom)
         scaled_speed = (self.pan_speed / safe_zoom) * self.pan_sensitivity
         
-        # Handle vertical panning
-        if Qt.Key_W in self.keys_pressed or Qt.Key_Up in self.keys_pressed:
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - int(scaled_speed)
-            )
-        if Qt.Key_S in self.keys_pressed or Qt.Key_Down in self.keys_pressed:
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() + int(scaled_speed)
-            )
-        
-        # Handle horizontal panning
-        if Qt.Key_A in self.keys_pressed or Qt.Key_Left in self.keys_pressed:
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - int(scaled_speed)
-            )
-        if Qt.Key_D in self.keys_pressed or Qt.Key_Right in self.keys_pressed:
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() + int(scaled_speed)
-            )
+        # Whole pixels to move this frame; the fraction carries to the next
+        distance = scaled_speed * self._pan_clock.restart() / self.PAN_FRAME_MS + self._pan_carry
+        step = int(distance)
+        self._pan_carry = distance - step
         
-        # Update the scene to refresh grid
-        self.scene().update()
+        # Net movement per axis, so each scrollbar is written at most once
+        dy = (bool(keys & self._PAN_DOWN) - bool(keys & self._PAN_UP)) * step
+        dx = (bool(keys & self._PAN_RIGHT) - bool(keys & self._PAN_LEFT)) * step
+        if dy:
+            self._vbar.setValue(self._vbar.value() + dy)
+        if dx:
+            self._hbar.setValue(self._hbar.value() + dx)
     
     def mousePressEvent(self, event):
         """Handle mouse press for panning, system placement, and route creation.
@@ -342,29 +517,35 @@ class MapView(QGraphicsView):
         - Click on RouteItem: Select the route
         """
         # Middle mouse button or Space + left mouse button for panning
-        if event.button() == Qt.MiddleButton or \
-           (event.button() == Qt.LeftButton and self.space_pressed):
+        if event.button() == Qt.MiddleButton:
             self.is_panning = True
-            self.pan_start_pos = event.pos()
-            self.setCursor(Qt.ClosedHandCursor)
+            self._begin_interaction()
+            self._set_hand_pan(True)
+            super().mousePressEvent(self._as_left_button(event))
             event.accept()
+        elif event.button() == Qt.LeftButton and self.space_pressed:
+            self.is_panning = True
+            self._begin_interaction()
+            super().mousePressEvent(event)
         # In routes mode, handle clicks for polyline route creation
         elif self.routes_mode_active:
+            # Hit-test once; every button branch below works on this item.
+            # SystemItem and RouteItem have no subclasses, so comparing the
+            # exact type is enough and cheaper than isinstance().
+            item = self.itemAt(event.pos())
+            item_type = type(item)
+            is_route = item_type is RouteItem
+            
+            # Labels are part of the SystemItem's shape, so a click on the
+            # name hits the system itself
+            system_item = item if item_type is SystemItem else None
+            
             if event.button() == Qt.LeftButton:
-                # Get item at click position
-                item = self.itemAt(event.pos())
                 scene_pos = self.mapToScene(event.pos())
                 
-                # Check if item is a system or if parent is a system (for label clicks)
-                system_item = None
-                if isinstance(item, SystemItem):
-                    system_item = item
-                elif item and isinstance(item.parentItem(), SystemItem):
-                    system_item = item.parentItem()
-                
                 # Check if CTRL is pressed for group selection (not while drawing)
                 if not self.route_drawing_active and (event.modifiers() & Qt.ControlModifier):
-                    if isinstance(item, RouteItem):
+                    if is_route:
                         # Toggle route for group selection
                         self.toggle_route_group_selection(item)
                         event.accept()
@@ -382,17 +563,9 @@ class MapView(QGraphicsView):
                         # Clicking on empty space - add intermediate point
                         self.route_drawing_points.append(scene_pos)
                         
-                        # Update visual preview
-                        # Find start system position
-                        start_system_item = None
-                        for item in self.scene().items():
-                            if isinstance(item, SystemItem):
-                                if item.get_system_data().id == self.route_drawing_start_system_id:
-                                    start_system_item = item
-                                    break
-                        
-                        if start_system_item:
-                            self.update_route_drawing_preview(start_system_item.pos())
+                        # Update visual preview from the start system position
+                        if self.route_drawing_start_pos is not None:
+                            self.update_route_drawing_preview(self.route_drawing_start_pos)
                         
                         event.accept()
                         return
@@ -403,7 +576,7 @@ class MapView(QGraphicsView):
                     self.start_route_drawing.emit(system_item)
                     event.accept()
                     return
-                elif isinstance(item, RouteItem):
+                elif is_route:
                     # Just select the route (no more ghost-line editing)
                     super().mousePressEvent(event)
                     return
@@ -420,23 +593,16 @@ class MapView(QGraphicsView):
                     return
                 else:
                     scene_pos = self.mapToScene(event.pos())
-                    item = self.itemAt(event.pos())
                     
                     # Check if we're in route editing mode
                     if self.route_editing_mode_active:
                         # Check if clicking on a system
-                        system_item = None
-                        if isinstance(item, SystemItem):
-                            system_item = item
-                        elif item and isinstance(item.parentItem(), SystemItem):
-                            system_item = item.parentItem()
-                        
                         if system_item:
                             # Show system context menu for route editing
                             self.system_context_menu_requested.emit(system_item, event.globalPos())
                             event.accept()
                             return
-                        elif isinstance(item, RouteItem):
+                        elif is_route:
                             # Check if clicking on a route segment
                             segment_info = item.get_segment_at_point(scene_pos)
                             if segment_info:
@@ -450,7 +616,7 @@ class MapView(QGraphicsView):
                                 return
                     else:
                         # Not in editing mode - show normal route context menu
-                        if isinstance(item, RouteItem):
+                        if is_route:
                             self.show_route_context_menu(event.globalPos(), item)
                             event.accept()
                         return
@@ -460,9 +626,9 @@ class MapView(QGraphicsView):
         # In systems mode, handle clicks for placement/editing
         elif self.systems_mode_active:
             scene_pos = self.mapToScene(event.pos())
+            # Check if clicking on an existing system
+            item = self.itemAt(event.pos())
             if event.button() == Qt.LeftButton:
-                # Check if clicking on an existing system
-                item = self.itemAt(event.pos())
                 if not isinstance(item, SystemItem):
                     # Left click on empty space - place new system
                     self.system_click.emit(scene_pos, False)
@@ -473,7 +639,6 @@ class MapView(QGraphicsView):
                     self.dragging_item = True
             elif event.button() == Qt.RightButton:
                 # Right click - edit existing system if clicked
-                item = self.itemAt(event.pos())
                 if isinstance(item, SystemItem):
                     self.system_click.emit(scene_pos, True)
                     event.accept()
@@ -490,34 +655,20 @@ class MapView(QGraphicsView):
         else:
             super().mousePressEvent(event)
     
-    def mouseMoveEvent(self, event):
-        """Handle mouse move for panning."""
-        if self.is_panning and self.pan_start_pos is not None:
-            # Calculate delta
-            delta = event.pos() - self.pan_start_pos
-            self.pan_start_pos = event.pos()
-            
-            # Update scroll bars
-            self.horizontalScrollBar().setValue(
-                self.horizontalScrollBar().value() - delta.x()
-            )
-            self.verticalScrollBar().setValue(
-                self.verticalScrollBar().value() - delta.y()
-            )
-            
-            # Update the scene to refresh grid
-            self.scene().update()
-            event.accept()
-        else:
-            super().mouseMoveEvent(event)
-    
     def mouseReleaseEvent(self, event):
         """Handle mouse release to stop panning and track item movements."""
-        if event.button() == Qt.MiddleButton or \
-           (event.button() == Qt.LeftButton and self.is_panning):
+        if self.is_panning and event.button() in (Qt.MiddleButton, Qt.LeftButton):
+            if event.button() == Qt.MiddleButton:
+                event = self._as_left_button(event)
+            super().mouseReleaseEvent(event)
+            # A system pressed before panning started may not get this
+            # release; finish its drag so its position reaches the data model
+            for item in self.scene().selectedItems():
+                if type(item) is SystemItem:
+                    item.end_drag()
             self.is_panning = False
-            self.pan_start_pos = None
-            self.setCursor(Qt.ArrowCursor)
+            self._set_hand_pan(self.space_pressed)
+            self._end_interaction()
             event.accept()
         else:
             # Check if we were dragging an item
@@ -570,6 +721,7 @@ class MapView(QGraphicsView):
         """Cancel the current route drawing operation."""
         self.route_drawing_active = False
         self.route_drawing_start_system_id = None
+        self.route_drawing_start_pos = None
         self.route_drawing_points = []
         
         # Remove preview path if it exists
@@ -582,32 +734,30 @@ class MapView(QGraphicsView):
     def update_route_drawing_preview(self, start_pos: QPointF):
         """Update the visual preview of the route being drawn.
         
+        The preview is kept as one item between clicks; only the points added
+        since the last update are appended to its path.
+        
         Args:
             start_pos: Position of the start system
         """
-        # Remove old preview if it exists
-        if self.route_drawing_preview_item:
-            self.scene().removeItem(self.route_drawing_preview_item)
-            self.route_drawing_preview_item = None
+        if not self.route_drawing_points:
+            return
         
-        # Create path for preview
-        if len(self.route_drawing_points) > 0:
-            from PySide6.QtGui import QPainterPath, QPen
-            from PySide6.QtCore import Qt
-            
-            path = QPainterPath()
-            path.moveTo(start_pos)
-            
-            # Draw through all intermediate points
-            for point in self.route_drawing_points:
-                path.lineTo(point)
-            
+        if self.route_drawing_preview_item is None:
             # Create preview item with dashed line style
-            self.route_drawing_preview_item = QGraphicsPathItem(path)
+            path = QPainterPath(start_pos)
+            self.route_drawing_preview_item = QGraphicsPathItem()
             pen = QPen(QColor(100, 150, 255), 2, Qt.DashLine)  # Blue dashed line
             self.route_drawing_preview_item.setPen(pen)
             self.route_drawing_preview_item.setZValue(-1)  # Below other items
             self.scene().addItem(self.route_drawing_preview_item)
+        else:
+            path = self.route_drawing_preview_item.path()
+        
+        # The path holds the start point plus every point drawn so far
+        for point in self.route_drawing_points[path.elementCount() - 1:]:
+            path.lineTo(point)
+        self.route_drawing_preview_item.setPath(path)
     
     def set_pan_sensitivity(self, sensitivity: float):
         """Set the pan sensitivity multiplier.
@@ -664,26 +814,15 @@ class MapView(QGraphicsView):
         self.position_zoom_indicator()
 
 
-def prettify_id(id_string: str) -> str:
-    """Convert an ID string to a human-readable label.
-    
-    Args:
-        id_string: ID string with underscores (e.g., "mining_facility")
-        
-    Returns:
-        Prettified string (e.g., "Mining Facility")
-    """
-    return id_string.replace('_', ' ').title()
-
-
 class FacilityPopup(QDialog):
     """Dialog for selecting facilities organized by category.
     
     Displays facilities from facility_flags.json in a tab-based interface,
-    with one tab per category containing checkboxes for each facility.
+    with one tab per category containing a list of checkable facilities.
+    A tab's list is filled the first time the tab is shown.
     """
     
-    def __init__(self, selected_facilities: list[str], parent=None):
+    def __init__(self, selected_facilities: Sequence[str], parent=None):
         """Initialize the facility selection dialog.
         
         Args:
@@ -691,7 +830,7 @@ class FacilityPopup(QDialog):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.selected_facilities = selected_facilities.copy()
+        self.selected_facilities = list(selected_facilities)
         self.setWindowTitle("Edit Facilities")
         self.setModal(True)
         self.setMinimumSize(600, 400)
@@ -703,40 +842,26 @@ class FacilityPopup(QDialog):
         data_loader = get_data_loader()
         
         # Create tab widget
-        from PySide6.QtWidgets import QTabWidget, QCheckBox, QScrollArea
+        from PySide6.QtWidgets import QTabWidget
         self.tab_widget = QTabWidget()
         
-        # Store checkboxes for retrieval
-        self.checkboxes = {}
+        # Store checkable list items for retrieval (only for built tabs)
+        self.facility_items = {}
         
-        # Get facility categories
+        # Get facility categories and their display labels
         categories = data_loader.get_facility_categories()
+        self._labels = data_loader.get_facility_labels()
         
-        # Create a tab for each category
+        # Create an empty tab for each category: one list view rather than
+        # a checkbox widget per facility, filled by _populate_tab()
+        self._tab_facilities: list[list[str]] = []
+        self._built_tabs: set[int] = set()
         for category_name, facility_ids in categories.items():
-            tab_widget = QWidget()
-            tab_layout = QVBoxLayout(tab_widget)
-            
-            # Create checkboxes for each facility
-            for facility_id in facility_ids:
-                # Prettify the facility ID for display
-                display_name = prettify_id(facility_id)
-                checkbox = QCheckBox(display_name)
-                checkbox.setChecked(facility_id in self.selected_facilities)
-                self.checkboxes[facility_id] = checkbox
-                tab_layout.addWidget(checkbox)
-            
-            # Add stretch to push checkboxes to top
-            tab_layout.addStretch()
-            
-            # Create scroll area
-            scroll = QScrollArea()
-            scroll.setWidget(tab_widget)
-            scroll.setWidgetResizable(True)
-            
-            # Add tab with prettified name
-            tab_title = prettify_id(category_name)
-            self.tab_widget.addTab(scroll, tab_title)
+            self.tab_widget.addTab(QListWidget(), self._labels[category_name])
+            self._tab_facilities.append(facility_ids)
+        
+        self.tab_widget.currentChanged.connect(self._populate_tab)
+        self._populate_tab(self.tab_widget.currentIndex())
         
         layout.addWidget(self.tab_widget)
         
@@ -746,26 +871,69 @@ class FacilityPopup(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def _populate_tab(self, index: int):
+        """Fill a category tab's list with checkable facilities, once.
+        
+        Args:
+            index: Tab index (-1 if there are no tabs)
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        
+        from PySide6.QtWidgets import QListWidgetItem
+        list_widget = self.tab_widget.widget(index)
+        selected = set(self.selected_facilities)
+        for facility_id in self._tab_facilities[index]:
+            item = QListWidgetItem(self._labels[facility_id])
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if facility_id in selected else Qt.Unchecked)
+            item.setData(Qt.UserRole, facility_id)
+            self.facility_items[facility_id] = item
+            list_widget.addItem(item)
+    
+    def reset_selection(self, selected_facilities: Sequence[str]):
+        """Reset the check states for reuse with another selection.
+        
+        Args:
+            selected_facilities: List of currently selected facility IDs
+        """
+        self.selected_facilities = list(selected_facilities)
+        selected = set(self.selected_facilities)
+        for facility_id, item in self.facility_items.items():
+            item.setCheckState(Qt.Checked if facility_id in selected else Qt.Unchecked)
+    
     def get_selected_facilities(self) -> list[str]:
         """Get the list of selected facility IDs.
         
         Returns:
             List of selected facility IDs
         """
+        # Tabs never shown still hold the initial selection
+        initial = set(self.selected_facilities)
         selected = []
-        for facility_id, checkbox in self.checkboxes.items():
-            if checkbox.isChecked():
-                selected.append(facility_id)
+        for facility_ids in self._tab_facilities:
+            for facility_id in facility_ids:
+                item = self.facility_items.get(facility_id)
+                if item is None:
+                    if facility_id in initial:
+                        selected.append(facility_id)
+                elif item.checkState() == Qt.Checked:
+                    selected.append(facility_id)
         return selected
 
 
 class GoodsPopup(QDialog):
     """Dialog for selecting goods for imports or exports.
     
-    Displays goods from goods.json in a multi-select list with optional filtering.
+    Displays goods from goods.json in a checkable list with optional filtering.
+    The list is built once; the search bar only changes a filter proxy, so
+    checked goods stay checked while they are filtered out.
     """
     
-    def __init__(self, selected_goods: list[str], mode: str = "imports", parent=None):
+    NAME_ROLE = Qt.UserRole + 1  # Item data role holding the good's name, used for filtering
+    
+    def __init__(self, selected_goods: Sequence[str], mode: str = "imports", parent=None):
         """Initialize the goods selection dialog.
         
         Args:
@@ -774,7 +942,7 @@ class GoodsPopup(QDialog):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.selected_goods = selected_goods.copy()
+        self.selected_goods = list(selected_goods)
         self.mode = mode
         self.setWindowTitle(f"Edit {mode.capitalize()}")
         self.setModal(True)
@@ -787,26 +955,43 @@ class GoodsPopup(QDialog):
         from PySide6.QtWidgets import QLineEdit
         data_loader = get_data_loader()
         
+        # Get goods data
+        self.goods_data = data_loader.get_goods()
+        
+        # Build the goods model
+        self.model = QStandardItemModel(self)
+        for good in self.goods_data:
+            good_id = good.get("id", "")
+            name = good.get("name", good_id)
+            tier = good.get("tier", "")
+            
+            item = QStandardItem(f"{name} (Tier {tier})")
+            item.setEditable(False)
+            item.setCheckable(True)
+            item.setData(good_id, Qt.UserRole)
+            item.setData(name, self.NAME_ROLE)
+            self.model.appendRow(item)
+        self.apply_selection()
+        
+        # Filter by name, case-insensitively
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterRole(self.NAME_ROLE)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        
         # Add search/filter bar
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search goods...")
         self.search_input.textChanged.connect(self.filter_goods)
         layout.addWidget(self.search_input)
         
-        # Create list widget
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(QListWidget.MultiSelection)
-        
-        # Get goods data
-        self.goods_data = data_loader.get_goods()
-        
-        # Populate list
-        self.populate_list()
-        
-        layout.addWidget(self.list_widget)
+        # Create list view
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        layout.addWidget(self.list_view)
         
         # Add info label
-        info_label = QLabel("Hold Ctrl/Cmd to select multiple items")
+        info_label = QLabel("Check the goods to include")
         info_label.setStyleSheet("color: gray; font-style: italic;")
         layout.addWidget(info_label)
         
@@ -816,35 +1001,26 @@ class GoodsPopup(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
-    def populate_list(self, filter_text: str = ""):
-        """Populate the list widget with goods.
+    def apply_selection(self):
+        """Set each good's check state from selected_goods."""
+        selected = set(self.selected_goods)
+        for row in range(self.model.rowCount()):
+            item = self.model.item(row)
+            item.setCheckState(Qt.Checked if item.data(Qt.UserRole) in selected else Qt.Unchecked)
+    
+    def reset_selection(self, selected_goods: Sequence[str], mode: str):
+        """Reset the dialog for reuse with another selection.
         
         Args:
-            filter_text: Optional filter string to limit displayed goods
+            selected_goods: List of currently selected good IDs
+            mode: Either "imports" or "exports" for dialog title
         """
-        self.list_widget.clear()
-        
-        for good in self.goods_data:
-            good_id = good.get("id", "")
-            name = good.get("name", good_id)
-            tier = good.get("tier", "")
-            
-            # Apply filter
-            if filter_text and filter_text.lower() not in name.lower():
-                continue
-            
-            # Create display text
-            display_text = f"{name} (Tier {tier})"
-            
-            # Add item
-            from PySide6.QtWidgets import QListWidgetItem
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, good_id)
-            self.list_widget.addItem(item)
-            
-            # Select if in selected_goods
-            if good_id in self.selected_goods:
-                item.setSelected(True)
+        self.selected_goods = list(selected_goods)
+        if mode != self.mode:
+            self.mode = mode
+            self.setWindowTitle(f"Edit {mode.capitalize()}")
+        self.search_input.clear()
+        self.apply_selection()
     
     def filter_goods(self, text: str):
         """Filter the goods list based on search text.
@@ -852,20 +1028,19 @@ class GoodsPopup(QDialog):
         Args:
             text: Search text
         """
-        self.populate_list(text)
+        self.proxy.setFilterFixedString(text)
     
     def get_selected_goods(self) -> list[str]:
         """Get the list of selected good IDs.
         
         Returns:
-            List of selected good IDs
+            List of selected good IDs, including any hidden by the filter
         """
         selected = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.isSelected():
-                good_id = item.data(Qt.UserRole)
-                selected.append(good_id)
+        for row in range(self.model.rowCount()):
+            item = self.model.item(row)
+            if item.checkState() == Qt.Checked:
+                selected.append(item.data(Qt.UserRole))
         return selected
 
 
@@ -981,6 +1156,10 @@ class StatsWidget(QWidget):
         super().__init__(parent)
         self.current_system: Optional[SystemData] = None
         
+        # Editor popups, created on first use and reused afterwards
+        self._facility_popup: Optional[FacilityPopup] = None
+        self._goods_popup: Optional[GoodsPopup] = None
+        
         # Import data loader
         from core.data_loader import get_data_loader
         self.data_loader = get_data_loader()
@@ -1169,14 +1348,30 @@ class StatsWidget(QWidget):
         population_id = self.population_combo.itemData(index)
         self.current_system.population_id = population_id
     
+    def _get_facility_popup(self, selected_facilities: Sequence[str]) -> FacilityPopup:
+        """Get the facilities dialog, reset to the given selection."""
+        if self._facility_popup is None:
+            self._facility_popup = FacilityPopup(selected_facilities, self)
+        else:
+            self._facility_popup.reset_selection(selected_facilities)
+        return self._facility_popup
+    
+    def _get_goods_popup(self, selected_goods: Sequence[str], mode: str) -> GoodsPopup:
+        """Get the goods dialog, reset to the given selection and mode."""
+        if self._goods_popup is None:
+            self._goods_popup = GoodsPopup(selected_goods, mode, self)
+        else:
+            self._goods_popup.reset_selection(selected_goods, mode)
+        return self._goods_popup
+    
     def edit_facilities(self):
         """Open the facilities editor dialog."""
         if self.current_system is None:
             return
         
-        dialog = FacilityPopup(self.current_system.facilities, self)
+        dialog = self._get_facility_popup(self.current_system.facilities)
         if dialog.exec() == QDialog.Accepted:
-            self.current_system.facilities = dialog.get_selected_facilities()
+            self.current_system.facilities = intern_ids(dialog.get_selected_facilities())
             self.update_summaries()
     
     def edit_imports(self):
@@ -1184,9 +1379,9 @@ class StatsWidget(QWidget):
         if self.current_system is None:
             return
         
-        dialog = GoodsPopup(self.current_system.imports, "imports", self)
+        dialog = self._get_goods_popup(self.current_system.imports, "imports")
         if dialog.exec() == QDialog.Accepted:
-            self.current_system.imports = dialog.get_selected_goods()
+            self.current_system.imports = intern_ids(dialog.get_selected_goods())
             self.update_summaries()
     
     def edit_exports(self):
@@ -1194,9 +1389,9 @@ class StatsWidget(QWidget):
         if self.current_system is None:
             return
         
-        dialog = GoodsPopup(self.current_system.exports, "exports", self)
+        dialog = self._get_goods_popup(self.current_system.exports, "exports")
         if dialog.exec() == QDialog.Accepted:
-            self.current_system.exports = dialog.get_selected_goods()
+            self.current_system.exports = intern_ids(dialog.get_selected_goods())
             self.update_summaries()
 
 
@@ -1741,6 +1936,14 @@ class StarMapEditor(QMainWindow):
     # UI Constants
     SENSITIVITY_SCALE_FACTOR = 100  # Multiplier for slider values to sensitivity values
     
+    # Route group label text colors, shared by all labels
+    _GROUP_LABEL_DARK_COLOR = QColor(200, 220, 255)
+    _GROUP_LABEL_LIGHT_COLOR = QColor(0, 0, 100)
+    
+    # System label text colors, shared by all systems
+    _SYSTEM_LABEL_DARK_COLOR = QColor(Qt.white)
+    _SYSTEM_LABEL_LIGHT_COLOR = QColor(Qt.black)
+    
     def __init__(self):
         super().__init__()
         
@@ -1751,15 +1954,22 @@ class StarMapEditor(QMainWindow):
         
         # Graphics items storage
         self.template_items: Dict[str, TemplateItem] = {}  # id -> TemplateItem
+        self.template_loader = TemplateImageLoader()  # Decodes images off the UI thread
+        self.template_loader.image_loaded.connect(self._on_template_image_loaded)
+        self._pending_templates: Dict[str, TemplateData] = {}  # Template ID -> data, image being decoded
         self.system_items: Dict[str, SystemItem] = {}  # id -> SystemItem
         self.route_items: Dict[str, RouteItem] = {}  # id -> RouteItem
         self.route_group_labels: Dict[str, QGraphicsTextItem] = {}  # group_id -> label
+        self._group_label_font = QFont()  # Shared by all route group labels
+        self._group_label_font.setPointSize(11)
+        self._group_label_font.setBold(True)
         
         # Current mode
         self.current_mode = None  # None, 'template', 'systems', 'routes', 'zones'
         
         # Selected template for workspace operations
         self.selected_template: Optional[TemplateItem] = None
+        self._selected_systems: List[SystemItem] = []  # Kept by on_selection_changed
         
         # Selected route for editing operations
         self.selected_route: Optional[RouteItem] = None
@@ -1775,7 +1985,9 @@ class StarMapEditor(QMainWindow):
         self.routes_selected_for_group: set[str] = set()  # Track route IDs selected for grouping
         
         # Theme state
-        self.is_dark_mode = True  # Default to dark mode
+        # None until init_ui applies the default (dark) theme, so that
+        # first apply_dark_mode() call is not skipped as a no-op
+        self.is_dark_mode: Optional[bool] = None
         
         self.init_ui()
     
@@ -2030,6 +2242,15 @@ class StarMapEditor(QMainWindow):
         self.light_mode_action.setChecked(False)
         self.light_mode_action.triggered.connect(self.apply_light_mode)
         view_menu.addAction(self.light_mode_action)
+        
+        view_menu.addSeparator()
+        
+        # OpenGL rendering action (raster rendering stays the default)
+        self.opengl_action = QAction('Use &OpenGL Rendering', self)
+        self.opengl_action.setCheckable(True)
+        self.opengl_action.setChecked(False)
+        self.opengl_action.toggled.connect(self.toggle_opengl_rendering)
+        view_menu.addAction(self.opengl_action)
     
     def create_workspace_toolbar(self) -> QWidget:
         """Create the workspace toolbar for template mode."""
@@ -2242,6 +2463,9 @@ class StarMapEditor(QMainWindow):
         
         # Uncheck light mode
         self.light_mode_action.setChecked(False)
+        if self.is_dark_mode:
+            # Already dark; nothing to recolor
+            return
         self.is_dark_mode = True
         
         # Set dark background for the scene
@@ -2251,26 +2475,33 @@ class StarMapEditor(QMainWindow):
         self.scene.grid_color = QColor(144, 238, 144, 80)  # Lighter, more transparent green
         
         # Update route colors for better visibility on dark background
-        RouteItem.NORMAL_COLOR = QColor(100, 200, 255)  # Light blue
-        RouteItem.SELECTED_COLOR = QColor(255, 255, 100)  # Yellow
-        RouteItem.GROUP_SELECTION_COLOR = QColor(255, 150, 255)  # Magenta
+        RouteItem.use_theme(dark=True)
         
-        # Update all existing routes
+        # Re-pen existing routes. Each route caches its rendering
+        # (DeviceCoordinateCache), which a scene-wide invalidate() does not
+        # refresh, so the pen change on each route is what recolors it
         for route_item in self.route_items.values():
             route_item.update_visual_state()
         
         # Update system label colors
         for system_item in self.system_items.values():
-            if hasattr(system_item, 'label'):
-                system_item.label.setDefaultTextColor(Qt.white)
+            system_item.set_label_color(self._SYSTEM_LABEL_DARK_COLOR)
         
         # Update route group label colors
         for label in self.route_group_labels.values():
-            label.setDefaultTextColor(QColor(200, 220, 255))
+            label.setDefaultTextColor(self._GROUP_LABEL_DARK_COLOR)
         
         # Force scene update
         self.scene.update()
     
+    def toggle_opengl_rendering(self, enabled: bool):
+        """Switch the map view between OpenGL and raster rendering.
+        
+        Args:
+            enabled: True to render through OpenGL
+        """
+        self.view.set_opengl_enabled(enabled)
+    
     def apply_light_mode(self):
         """Apply light mode theme to the application."""
         if not self.light_mode_action.isChecked():
@@ -2281,6 +2512,9 @@ class StarMapEditor(QMainWindow):
         
         # Uncheck dark mode
         self.dark_mode_action.setChecked(False)
+        if self.is_dark_mode is False:
+            # Already light; nothing to recolor
+            return
         self.is_dark_mode = False
         
         # Set light background for the scene
@@ -2290,22 +2524,21 @@ class StarMapEditor(QMainWindow):
         self.scene.grid_color = QColor(100, 150, 100, 128)  # Darker green, more visible
         
         # Update route colors for better visibility on light background
-        RouteItem.NORMAL_COLOR = QColor(50, 100, 200)  # Darker blue
-        RouteItem.SELECTED_COLOR = QColor(200, 150, 0)  # Dark yellow/gold
-        RouteItem.GROUP_SELECTION_COLOR = QColor(200, 50, 200)  # Dark magenta
+        RouteItem.use_theme(dark=False)
         
-        # Update all existing routes
+        # Re-pen existing routes. Each route caches its rendering
+        # (DeviceCoordinateCache), which a scene-wide invalidate() does not
+        # refresh, so the pen change on each route is what recolors it
         for route_item in self.route_items.values():
             route_item.update_visual_state()
         
         # Update system label colors
         for system_item in self.system_items.values():
-            if hasattr(system_item, 'label'):
-                system_item.label.setDefaultTextColor(Qt.black)
+            system_item.set_label_color(self._SYSTEM_LABEL_LIGHT_COLOR)
         
         # Update route group label colors
         for label in self.route_group_labels.values():
-            label.setDefaultTextColor(QColor(0, 0, 100))
+            label.setDefaultTextColor(self._GROUP_LABEL_LIGHT_COLOR)
         
         # Force scene update
         self.scene.update()
@@ -2317,13 +2550,15 @@ class StarMapEditor(QMainWindow):
         if not self.check_unsaved_changes():
             return
         
-        # Clear everything
-        self.scene.clear()
+        # Clear everything. The item dicts are emptied before the scene so
+        # no Python references remain while Qt deletes the items.
         self.project = MapProject()
         self.template_items.clear()
         self.system_items.clear()
+        self._pending_templates.clear()
         self.route_items.clear()
         self.route_group_labels.clear()
+        self.scene.clear()
         self.current_file_path = None
         self.unsaved_changes = False
         
@@ -2360,21 +2595,24 @@ class StarMapEditor(QMainWindow):
         if file_path:
             project = load_project(Path(file_path))
             if project:
-                # Clear current state
-                self.scene.clear()
+                # Clear current state (dicts first, as in new_project)
                 self.template_items.clear()
                 self.system_items.clear()
+                self._pending_templates.clear()
                 self.route_items.clear()
                 self.route_group_labels.clear()
+                self.scene.clear()
                 
                 # Load project
                 self.project = project
                 self.current_file_path = Path(file_path)
                 self.unsaved_changes = False
                 
-                # Restore templates
+                # Restore templates; their images are decoded on a worker
+                # and they are added in _on_template_image_loaded
                 for template_data in self.project.templates:
-                    self.add_template_to_scene(template_data)
+                    self._pending_templates[template_data.id] = template_data
+                    self.template_loader.load(template_data.id, template_data.filepath)
                 
                 # Restore systems
                 for system_data in self.project.systems.values():
@@ -2398,12 +2636,9 @@ class StarMapEditor(QMainWindow):
                 # Recompute scene rect to encompass all loaded items
                 self.recompute_scene_rect()
                     
-                # Set a reasonable initial view
-                if self.template_items:
-                    first_template = list(self.template_items.values())[0]
-                    self.view.fitInView(first_template.boundingRect(), Qt.KeepAspectRatio)
-                    self.view.update_zoom_indicator()
-                elif self.project.systems:
+                # Set a reasonable initial view. With templates, the view is
+                # fitted to the first one once its image has loaded.
+                if self.project.systems and not self.project.templates:
                     # No templates but has systems - fit view to systems
                     self.view.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
                     self.view.update_zoom_indicator()
@@ -2574,6 +2809,7 @@ class StarMapEditor(QMainWindow):
             if route_data:
                 # Rebuild route path from updated data
                 route_item.recompute_path()
+        self.update_route_group_labels()
         
         # Refresh template items
         for template_id, template_item in self.template_items.items():
@@ -2583,9 +2819,7 @@ class StarMapEditor(QMainWindow):
                 template_item.setScale(template_data.scale)
                 # Update data reference
                 template_item.template_data = template_data
-        
-        # Update the scene
-        self.scene.update()
+        # setPos/setScale/recompute_path schedule the repaint of what changed
     
     # ===== Unsaved Changes and Window Management =====
     
@@ -2792,41 +3026,89 @@ class StarMapEditor(QMainWindow):
         )
         
         if file_path:
-            # Create template data (IMAGE LAYER)
+            # Decode on a worker; the template is added in _on_template_image_loaded.
+            # Pending loads are keyed by template ID, so the same file can
+            # be loaded as two templates.
             template_data = TemplateData.create_new(file_path)
-            self.project.add_template(template_data)
-            
-            # Add to scene
-            template_item = self.add_template_to_scene(template_data)
-            
-            # Recompute scene rect to encompass all templates
-            self.recompute_scene_rect()
-            
-            # If this is the first template, enable grid and fit view
-            # Grid is now infinite and independent of template size
-            if len(self.project.templates) == 1:
-                self.scene.show_grid = True
-                self.view.resetTransform()
-                self.view.current_zoom = 1.0
-                self.view.fitInView(template_item.boundingRect(), Qt.KeepAspectRatio)
-                self.view.update_zoom_indicator()
-            
-            # Update scene
-            self.scene.update()
-            self.view.setFocus()
-            
-            self.mark_unsaved_changes()
+            self._pending_templates[template_data.id] = template_data
+            self.template_loader.load(template_data.id, file_path)
+            self.set_status_text("Loading template image...")
     
-    def add_template_to_scene(self, template_data: TemplateData) -> TemplateItem:
+    def _on_template_image_loaded(self, template_id: str, image: QImage, source_size: QSize):
+        """Add a template once its image has been decoded.
+        
+        Args:
+            template_id: ID of the template the image was loaded for
+            image: Decoded image (null if the file couldn't be read)
+            source_size: Size of the image in its file
+        """
+        template_data = self._pending_templates.pop(template_id, None)
+        if template_data is None:
+            # The project was replaced while the image was loading
+            return
+        if self.project.get_template(template_id) is not None:
+            # Restored by open_project, not a newly loaded template
+            self._add_restored_template(template_data, image, source_size)
+            return
+        
+        # Add template data (IMAGE LAYER)
+        self.project.add_template(template_data)
+        
+        # Add to scene
+        template_item = self.add_template_to_scene(template_data, image, source_size)
+        
+        # Recompute scene rect to encompass all templates
+        self.recompute_scene_rect()
+        
+        # If this is the first template, enable grid and fit view
+        # Grid is now infinite and independent of template size
+        if len(self.project.templates) == 1:
+            self.scene.show_grid = True
+            self.view.resetTransform()
+            self.view.current_zoom = 1.0
+            self.view.fitInView(template_item.sceneBoundingRect(), Qt.KeepAspectRatio)
+            self.view.update_zoom_indicator()
+        
+        # Adding the item (and refitting the view) repaints what is exposed
+        self.view.setFocus()
+        self.update_status_message()
+        
+        self.mark_unsaved_changes()
+    
+    def _add_restored_template(self, template_data: TemplateData, image: QImage,
+                               source_size: QSize):
+        """Add a template of an opened project once its image has been decoded.
+        
+        The template is already part of the project, so this is not an
+        unsaved change.
+        
+        Args:
+            template_data: The template's data, already in self.project
+            image: Decoded image (null if the file couldn't be read)
+            source_size: Size of the image in its file
+        """
+        template_item = self.add_template_to_scene(template_data, image, source_size)
+        self.recompute_scene_rect()
+        
+        # The initial view of an opened project shows its first template
+        if self.project.templates[0] is template_data:
+            self.view.fitInView(template_item.sceneBoundingRect(), Qt.KeepAspectRatio)
+            self.view.update_zoom_indicator()
+    
+    def add_template_to_scene(self, template_data: TemplateData,
+                              image: Optional[QImage] = None,
+                              source_size: Optional[QSize] = None) -> TemplateItem:
         """Add a template to the scene.
         
         Args:
             template_data: The TemplateData to add
+            image: Already decoded template image, read from the file if None
+            source_size: Size of the image in its file (see read_template_image)
             
         Returns:
             The created TemplateItem
         """
-        template_item = TemplateItem(template_data)
+        template_item = TemplateItem(template_data, image=image, source_size=source_size)
         self.scene.addItem(template_item)
         self.template_items[template_data.id] = template_item
         return template_item
@@ -2917,13 +3199,19 @@ class StarMapEditor(QMainWindow):
         selected_items = self.scene.selectedItems()
         template_selected = None
         route_selected = None
+        selected_systems = []
         
         for item in selected_items:
-            if isinstance(item, TemplateItem):
+            if isinstance(item, SystemItem):
+                selected_systems.append(item)
+            elif isinstance(item, TemplateItem):
                 template_selected = item
             elif isinstance(item, RouteItem):
                 route_selected = item
         
+        # Route editing actions read the selected system from this list
+        # instead of walking the scene selection again
+        self._selected_systems = selected_systems
         self.selected_template = template_selected
         self.update_workspace_controls()
         self.update_route_workspace_controls(route_selected)
@@ -2938,6 +3226,14 @@ class StarMapEditor(QMainWindow):
         if self.current_mode == 'stats':
             self.update_stats_inspector()
     
+    def _selected_system(self) -> Optional[SystemItem]:
+        """Get the selected system, or None if no system is selected.
+        
+        Served from the list on_selection_changed keeps; the scene emits
+        selectionChanged for removed and cleared items too, so it is never stale.
+        """
+        return self._selected_systems[0] if self._selected_systems else None
+    
     def on_item_modified(self):
         """Handle item modification (movement, etc.)."""
         # Mark project as having unsaved changes
@@ -2995,11 +3291,7 @@ class StarMapEditor(QMainWindow):
         self.selected_route = route_selected
         
         # Get currently selected system (if any)
-        selected_system = None
-        for item in self.scene.selectedItems():
-            if isinstance(item, SystemItem):
-                selected_system = item
-                break
+        selected_system = self._selected_system()
         
         if route_selected:
             route_data = route_selected.get_route_data()
@@ -3235,20 +3527,21 @@ class StarMapEditor(QMainWindow):
         # Create label
         label = QGraphicsTextItem()
         label.setPlainText(route_group.name)
-        label.setDefaultTextColor(QColor(200, 220, 255) if self.is_dark_mode else QColor(0, 0, 100))
-        font = QFont()
-        font.setPointSize(11)
-        font.setBold(True)
-        label.setFont(font)
+        label.setDefaultTextColor(self._GROUP_LABEL_DARK_COLOR if self.is_dark_mode
+                                  else self._GROUP_LABEL_LIGHT_COLOR)
+        label.setFont(self._group_label_font)
         
         # Make it non-selectable and non-movable
         label.setFlag(QGraphicsTextItem.ItemIsSelectable, False)
         label.setFlag(QGraphicsTextItem.ItemIsMovable, False)
         
-        # Position the label (centered on the group center)
+        # Position the label (centered on the group center). The text and
+        # font never change after creation, so the half size is stored on
+        # the label for update_route_group_labels
         label_bounds = label.boundingRect()
-        label.setPos(position.x() - label_bounds.width() / 2,
-                    position.y() - label_bounds.height() / 2)
+        half_size = QPointF(label_bounds.width() / 2, label_bounds.height() / 2)
+        label.setData(0, half_size)
+        label.setPos(position - half_size)
         
         # Set z-order above routes but below systems
         label.setZValue(7)
@@ -3269,41 +3562,59 @@ class StarMapEditor(QMainWindow):
         if not route_group.route_ids:
             return None
         
-        # Collect midpoints of all routes in the group
-        midpoints = []
+        # Sum the midpoints of all routes in the group; each route keeps the
+        # endpoint positions of its current path, so this makes no Qt calls
+        route_items = self.route_items
+        total_x = total_y = 0.0
+        count = 0
         for route_id in route_group.route_ids:
-            if route_id not in self.route_items:
+            route_item = route_items.get(route_id)
+            if route_item is None:
                 continue
-            
-            route_item = self.route_items[route_id]
-            start_pos = route_item.get_start_position()
-            end_pos = route_item.get_end_position()
-            
-            if start_pos and end_pos:
-                mid_x = (start_pos.x() + end_pos.x()) / 2.0
-                mid_y = (start_pos.y() + end_pos.y()) / 2.0
-                midpoints.append((mid_x, mid_y))
+            midpoint = route_item.get_midpoint()
+            if midpoint is not None:
+                total_x += midpoint[0]
+                total_y += midpoint[1]
+                count += 1
         
-        if not midpoints:
+        if not count:
             return None
         
         # Average all midpoints
-        avg_x = sum(p[0] for p in midpoints) / len(midpoints)
-        avg_y = sum(p[1] for p in midpoints) / len(midpoints)
-        
-        return QPointF(avg_x, avg_y)
+        return QPointF(total_x / count, total_y / count)
     
-    def update_route_group_labels(self):
-        """Update positions of all route group labels."""
-        for group_id, route_group in self.project.route_groups.items():
-            if group_id in self.route_group_labels:
+    def update_route_group_labels(self, group_ids: Optional[Iterable[str]] = None):
+        """Update positions of route group labels.
+        
+        Args:
+            group_ids: IDs of the groups whose routes changed; all groups
+                are updated if None
+        """
+        route_groups = self.project.route_groups
+        if group_ids is None:
+            group_ids = route_groups.keys()
+        for group_id in group_ids:
+            route_group = route_groups.get(group_id)
+            if route_group is not None and group_id in self.route_group_labels:
                 # Recalculate position
                 position = self.calculate_route_group_center(route_group)
                 if position:
                     label = self.route_group_labels[group_id]
-                    label_bounds = label.boundingRect()
-                    label.setPos(position.x() - label_bounds.width() / 2,
-                               position.y() - label_bounds.height() / 2)
+                    label.setPos(position - label.data(0))
+    
+    def update_route_group_labels_for_routes(self, route_ids: Iterable[str]):
+        """Update the labels of the route groups containing any of the given routes.
+        
+        Call after changing a route's geometry (e.g. its system chain), as
+        labels are otherwise only repositioned when systems move.
+        
+        Args:
+            route_ids: IDs of the routes whose geometry changed
+        """
+        route_ids = set(route_ids)
+        self.update_route_group_labels(
+            group_id for group_id, route_group in self.project.route_groups.items()
+            if not route_ids.isdisjoint(route_group.route_ids))
     
     def rebuild_route_group_labels(self):
         """Rebuild all route group labels from scratch."""
@@ -3434,6 +3745,7 @@ class StarMapEditor(QMainWindow):
         system_data = system_item.get_system_data()
         self.view.route_drawing_active = True
         self.view.route_drawing_start_system_id = system_data.id
+        self.view.route_drawing_start_pos = system_item.pos()
         self.view.route_drawing_points = []
         
         self.set_status_text(f"Route drawing: Click intermediate points, then click end system. Right-click or ESC to cancel.")
@@ -3523,9 +3835,11 @@ class StarMapEditor(QMainWindow):
             
             # Update route groups to remove this route
             groups_to_remove = []
+            changed_groups = set()
             for group_id, group in self.project.route_groups.items():
                 if route_id in group.route_ids:
                     group.route_ids.remove(route_id)
+                    changed_groups.add(group_id)
                     # Mark group for removal if empty
                     if len(group.route_ids) == 0:
                         groups_to_remove.append(group_id)
@@ -3538,8 +3852,8 @@ class StarMapEditor(QMainWindow):
                     self.scene.removeItem(self.route_group_labels[group_id])
                     del self.route_group_labels[group_id]
             
-            # Update remaining group labels
-            self.update_route_group_labels()
+            # Update the labels of groups that lost the route
+            self.update_route_group_labels(changed_groups.difference(groups_to_remove))
             
             # Refresh route selector after deletion
             self.refresh_route_selector()
@@ -3604,11 +3918,22 @@ class StarMapEditor(QMainWindow):
             self.mark_unsaved_changes()
     
     def update_routes_for_system_movement(self):
-        """Update all routes when systems have been moved."""
-        for route_item in self.route_items.values():
+        """Update all routes when systems have been moved.
+        
+        Only the labels of groups containing a route whose endpoints moved
+        are repositioned.
+        """
+        route_items = self.route_items
+        midpoints = {route_id: route_item.get_midpoint()
+                     for route_id, route_item in route_items.items()}
+        for route_item in route_items.values():
             route_item.update_from_system_movement()
-        # Also update route group label positions
-        self.update_route_group_labels()
+        
+        # Also update the labels of groups whose routes moved
+        moved_routes = {route_id for route_id, route_item in route_items.items()
+                        if route_item.get_midpoint() != midpoints[route_id]}
+        if moved_routes:
+            self.update_route_group_labels_for_routes(moved_routes)
     
     def toggle_route_for_group(self, route_id: str):
         """Toggle a route's selection for group creation.
@@ -3678,11 +4003,7 @@ class StarMapEditor(QMainWindow):
             return
         
         # Find selected system
-        selected_system = None
-        for item in self.scene.selectedItems():
-            if isinstance(item, SystemItem):
-                selected_system = item
-                break
+        selected_system = self._selected_system()
         
         if not selected_system:
             QMessageBox.warning(self, "No System Selected", "Please select a system to insert.")
@@ -3725,6 +4046,7 @@ class StarMapEditor(QMainWindow):
             insert_index = list_widget.currentRow()
             route_data.insert_system_at(insert_index, sys_id)
             self.selected_route.recompute_path()
+            self.update_route_group_labels_for_routes([route_data.id])
             self.mark_unsaved_changes()
             self.update_route_workspace_controls(self.selected_route)
     
@@ -3735,11 +4057,7 @@ class StarMapEditor(QMainWindow):
             return
         
         # Find selected system
-        selected_system = None
-        for item in self.scene.selectedItems():
-            if isinstance(item, SystemItem):
-                selected_system = item
-                break
+        selected_system = self._selected_system()
         
         if not selected_system:
             QMessageBox.warning(self, "No System Selected", "Please select a system to remove.")
@@ -3774,6 +4092,7 @@ class StarMapEditor(QMainWindow):
             try:
                 route_data.remove_system_by_id(sys_id)
                 self.selected_route.recompute_path()
+                self.update_route_group_labels_for_routes([route_data.id])
                 self.mark_unsaved_changes()
                 self.update_route_workspace_controls(self.selected_route)
             except ValueError as e:
@@ -3786,11 +4105,7 @@ class StarMapEditor(QMainWindow):
             return
         
         # Find selected system
-        selected_system = None
-        for item in self.scene.selectedItems():
-            if isinstance(item, SystemItem):
-                selected_system = item
-                break
+        selected_system = self._selected_system()
         
         if not selected_system:
             QMessageBox.warning(self, "No System Selected", "Please select a system to split at.")
@@ -3833,6 +4148,7 @@ class StarMapEditor(QMainWindow):
                 
                 # Update existing route rendering
                 self.selected_route.recompute_path()
+                self.update_route_group_labels_for_routes([route_data.id])
                 
                 # Select the new route
                 self.selected_route.setSelected(False)
@@ -3989,11 +4305,7 @@ class StarMapEditor(QMainWindow):
         
         if action == insert_action:
             # Find a selected system to insert
-            selected_system = None
-            for item in self.scene.selectedItems():
-                if isinstance(item, SystemItem):
-                    selected_system = item
-                    break
+            selected_system = self._selected_system()
             
             if not selected_system:
                 QMessageBox.warning(
@@ -4017,6 +4329,7 @@ class StarMapEditor(QMainWindow):
             # Insert after sys_id_1 (at segment_index + 1)
             route_data.insert_system_at(segment_index + 1, sys_id)
             route_item.recompute_path()
+            self.update_route_group_labels_for_routes([route_data.id])
             self.mark_unsaved_changes()
             self.update_route_workspace_controls(route_item)
             
@@ -4048,6 +4361,7 @@ class StarMapEditor(QMainWindow):
         try:
             route_data.remove_system_by_id(sys_id)
             self.selected_route.recompute_path()
+            self.update_route_group_labels_for_routes([route_data.id])
             self.mark_unsaved_changes()
             self.update_route_workspace_controls(self.selected_route)
         except ValueError as e:
@@ -4087,6 +4401,7 @@ class StarMapEditor(QMainWindow):
             
             # Update existing route rendering
             self.selected_route.recompute_path()
+            self.update_route_group_labels_for_routes([route_data.id])
             
             # Select the new route
             self.selected_route.setSelected(False)
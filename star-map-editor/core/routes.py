@@ -4,15 +4,15 @@ This module handles route data structures and graphics representation for
 creating polyline routes between star systems by clicking control points.
 """
 
-import uuid
+import os
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from PySide6.QtCore import Qt, QPointF
-from PySide6.QtWidgets import QGraphicsPathItem
-from PySide6.QtGui import QPainterPath, QPen, QColor
+from PySide6.QtWidgets import QGraphicsPathItem, QGraphicsItem
+from PySide6.QtGui import QPainterPath, QPen, QColor, QPolygonF
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteData:
     """Data model for a hyperlane route between systems.
     
@@ -24,7 +24,7 @@ class RouteData:
     2. Chain routes: Multiple systems in sequence (A → B → C)
     
     Attributes:
-        id: Unique identifier for the route (UUID string)
+        id: Unique identifier for the route (random 128-bit hex string; older projects use UUID strings)
         name: Display name of the route
         start_system_id: ID of the starting system (for backward compatibility)
         end_system_id: ID of the ending system (for backward compatibility)
@@ -53,7 +53,7 @@ class RouteData:
     @classmethod
     def create_new(cls, name: str, start_system_id: str, end_system_id: str,
                    control_points: Optional[List[tuple[float, float]]] = None):
-        """Create a new route with a generated UUID.
+        """Create a new route with a generated random ID.
         
         Args:
             name: Display name for the route
@@ -65,7 +65,7 @@ class RouteData:
             New RouteData instance
         """
         return cls(
-            id=str(uuid.uuid4()),
+            id=os.urandom(16).hex(),
             name=name,
             start_system_id=start_system_id,
             end_system_id=end_system_id,
@@ -289,9 +289,18 @@ class RouteItem(QGraphicsPathItem):
     
     # Visual configuration (UI SPACE)
     LINE_WIDTH = 3
-    NORMAL_COLOR = QColor(100, 200, 255)  # Light blue
-    SELECTED_COLOR = QColor(255, 255, 100)  # Yellow
-    GROUP_SELECTION_COLOR = QColor(255, 150, 255)  # Magenta
+    
+    # (normal, selected, group selection) colors per theme, built once and
+    # indexed by dark mode; see use_theme()
+    _PALETTES = (
+        # Light: darker blue, dark yellow/gold, dark magenta
+        (QColor(50, 100, 200), QColor(200, 150, 0), QColor(200, 50, 200)),
+        # Dark: light blue, yellow, magenta
+        (QColor(100, 200, 255), QColor(255, 255, 100), QColor(255, 150, 255)),
+    )
+    _palette_idx = 1  # Index of the active palette in _PALETTES
+    
+    _pens: Dict[tuple, QPen] = {}  # Shared pens keyed by (RGBA, width), see _pen()
     
     def __init__(self, route_data: RouteData, system_items_dict: Dict[str, 'SystemItem']):
         """Initialize the route graphics item.
@@ -304,9 +313,11 @@ class RouteItem(QGraphicsPathItem):
         self.route_data = route_data
         self.system_items = system_items_dict
         self.is_group_selected = False
+        self._path_sig = None  # Positions and control points of the current path
+        self._endpoint_items = None  # (start, end) SystemItems of the current path
         
         # Configure appearance (UI SPACE)
-        self.setPen(QPen(self.NORMAL_COLOR, self.LINE_WIDTH, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        self.setPen(self._pen(RouteItem._PALETTES[RouteItem._palette_idx][0], self.LINE_WIDTH))
         
         # Enable interaction
         self.setFlag(QGraphicsPathItem.ItemIsSelectable, True)
@@ -315,20 +326,34 @@ class RouteItem(QGraphicsPathItem):
         # Z-order: routes below systems but above templates
         self.setZValue(5)
         
+        # Cache the stroked path as a pixmap; Qt re-rasterizes it only when
+        # the path or pen changes, not on every viewport repaint
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
         # Initial path computation (WORLD SPACE coordinates)
         self.recompute_path()
     
     def get_start_position(self) -> Optional[QPointF]:
-        """Get the current position of the start system."""
-        if self.route_data.start_system_id in self.system_items:
-            return self.system_items[self.route_data.start_system_id].pos()
-        return None
+        """Get the current position of the start system.
+        
+        Uses the SystemItem resolved by the last recompute_path(), so no
+        dict lookup is needed while the route has a path.
+        """
+        if self._endpoint_items is not None:
+            return self._endpoint_items[0].pos()
+        system_item = self.system_items.get(self.route_data.start_system_id)
+        return system_item.pos() if system_item is not None else None
     
     def get_end_position(self) -> Optional[QPointF]:
-        """Get the current position of the end system."""
-        if self.route_data.end_system_id in self.system_items:
-            return self.system_items[self.route_data.end_system_id].pos()
-        return None
+        """Get the current position of the end system.
+        
+        Uses the SystemItem resolved by the last recompute_path(), so no
+        dict lookup is needed while the route has a path.
+        """
+        if self._endpoint_items is not None:
+            return self._endpoint_items[1].pos()
+        system_item = self.system_items.get(self.route_data.end_system_id)
+        return system_item.pos() if system_item is not None else None
     
     def recompute_path(self):
         """Recompute the route path based on current system positions and shape points.
@@ -341,41 +366,98 @@ class RouteItem(QGraphicsPathItem):
         # Get the system chain
         system_chain = self.route_data.get_system_chain()
         
-        # Get positions for all systems in chain
+        # Get positions for all systems in chain (one dict probe per system)
+        system_items = self.system_items
         positions = []
         for sys_id in system_chain:
-            if sys_id in self.system_items:
-                positions.append(self.system_items[sys_id].pos())
-            else:
+            system_item = system_items.get(sys_id)
+            if system_item is None:
                 # System not found - can't draw route
-                self.setPath(QPainterPath())
+                self._clear_path()
                 return
+            positions.append(system_item.pos())
         
         if len(positions) < 2:
-            self.setPath(QPainterPath())
+            self._clear_path()
             return
         
-        # Start path at first system
-        path.moveTo(positions[0])
+        # Keep the endpoint items for get_start_position/get_end_position;
+        # rebound on every rebuild, so replaced systems are picked up
+        self._endpoint_items = (system_items[system_chain[0]],
+                                system_items[system_chain[-1]])
+        
+        # Skip the rebuild (and the scene index update of setPath) when
+        # nothing the path depends on has changed, e.g. a sibling system moved
+        sig = (tuple((pos.x(), pos.y()) for pos in positions),
+               tuple(self.route_data.control_points))
+        if sig == self._path_sig and not self.path().isEmpty():
+            return
+        if self._path_sig is None:
+            # The previous path was empty (or this is the first build)
+            self.setFlag(QGraphicsItem.ItemHasNoContents, False)
+        self._path_sig = sig
         
         # For simple 2-system routes with control points, use control points
         if len(system_chain) == 2 and self.route_data.control_points:
-            # Draw through intermediate control points
+            # Draw through intermediate control points, passing the stored
+            # (x, y) floats straight to the scalar lineTo() overload rather
+            # than wrapping each one in a QPointF first
+            path.moveTo(positions[0])
+            line_to = path.lineTo
             for x, y in self.route_data.control_points:
-                path.lineTo(QPointF(x, y))
+                line_to(x, y)
             # Connect to end
-            path.lineTo(positions[1])
+            line_to(positions[1])
         else:
-            # For chain routes, just connect system to system
-            for i in range(1, len(positions)):
-                path.lineTo(positions[i])
+            # For chain routes the positions are already QPointFs; add the
+            # whole polyline in one call instead of a lineTo() per vertex
+            path.addPolygon(QPolygonF(positions))
         
         self.setPath(path)
     
+    def _clear_path(self):
+        """Drop the path of a route that cannot be drawn.
+        
+        The route is also flagged as having no contents, so Qt does not
+        call paint() for it until a path can be built again.
+        """
+        self._path_sig = None
+        self._endpoint_items = None
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self.setPath(QPainterPath())
+    
+    def get_midpoint(self) -> Optional[Tuple[float, float]]:
+        """Get the point halfway between the start and end system.
+        
+        Read from the positions recorded by the last recompute_path(), so no
+        Qt calls are made.
+        
+        Returns:
+            (x, y) in HSU, or None if the route has no path
+        """
+        sig = self._path_sig
+        if sig is None:
+            return None
+        positions = sig[0]
+        (start_x, start_y), (end_x, end_y) = positions[0], positions[-1]
+        return ((start_x + end_x) / 2.0, (start_y + end_y) / 2.0)
+    
+    def _on_selected_changed(self, value):
+        """Update the pen when the item is selected or deselected."""
+        self.update_visual_state()
+    
+    # itemChange handlers keyed by change type. Qt calls itemChange for many
+    # change types; a dict probe on a prebuilt key avoids looking up the
+    # enum members on every call.
+    _ITEM_CHANGE_HANDLERS = {
+        QGraphicsItem.ItemSelectedHasChanged: _on_selected_changed,
+    }
+    
     def itemChange(self, change, value):
         """Handle item changes, particularly selection."""
-        if change == QGraphicsPathItem.ItemSelectedHasChanged:
-            self.update_visual_state()
+        handler = self._ITEM_CHANGE_HANDLERS.get(change)
+        if handler is not None:
+            handler(self, value)
         return super().itemChange(change, value)
     
     def get_route_data(self) -> RouteData:
@@ -395,25 +477,51 @@ class RouteItem(QGraphicsPathItem):
         self.is_group_selected = selected
         self.update_visual_state()
     
+    @staticmethod
+    def use_theme(dark: bool):
+        """Switch to the route colors of the light or dark theme.
+        
+        Only the palette index changes; existing routes pick up the colors
+        on their next update_visual_state().
+        
+        Args:
+            dark: True for the dark theme palette
+        """
+        RouteItem._palette_idx = 1 if dark else 0
+    
+    @classmethod
+    def _pen(cls, color: QColor, width: int) -> QPen:
+        """Get the shared route pen for a color and width.
+        
+        Pens are cached by color value, so each palette color gets one pen
+        of each width.
+        """
+        key = (color.rgba(), width)
+        pen = cls._pens.get(key)
+        if pen is None:
+            pen = QPen(color, width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            cls._pens[key] = pen
+        return pen
+    
     def update_visual_state(self):
         """Update visual appearance based on selection state."""
+        palette = RouteItem._PALETTES[RouteItem._palette_idx]
         if self.is_group_selected:
-            self.setPen(QPen(self.GROUP_SELECTION_COLOR, self.LINE_WIDTH + 1, 
-                            Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            pen = self._pen(palette[2], self.LINE_WIDTH + 1)
         elif self.isSelected():
-            self.setPen(QPen(self.SELECTED_COLOR, self.LINE_WIDTH, 
-                            Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            pen = self._pen(palette[1], self.LINE_WIDTH)
         else:
-            self.setPen(QPen(self.NORMAL_COLOR, self.LINE_WIDTH,
-                            Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            pen = self._pen(palette[0], self.LINE_WIDTH)
+        # setPen invalidates the item cache, so only call it on a real change
+        if pen != self.pen():
+            self.setPen(pen)
     
     def get_segment_at_point(self, scene_pos: QPointF, threshold: float = 20.0) -> Optional[tuple[int, str, str]]:
         """Find which segment (pair of consecutive systems) is closest to the given point.
         
         Performance note: For routes with many segments, this performs a linear search.
-        Could be optimized with spatial indexing or by comparing squared distances
-        to avoid sqrt operations, but current implementation is simple and fast
-        enough for typical route sizes (< 100 segments).
+        Squared distances are compared against the squared threshold, so no
+        sqrt is taken per segment.
         
         Args:
             scene_pos: Position in scene coordinates
@@ -427,59 +535,61 @@ class RouteItem(QGraphicsPathItem):
         if len(system_chain) < 2:
             return None
         
-        # Get positions for all systems
+        # Get positions for all systems as plain (x, y) floats
         positions = []
         for sys_id in system_chain:
             if sys_id in self.system_items:
-                positions.append(self.system_items[sys_id].pos())
+                pos = self.system_items[sys_id].pos()
+                positions.append((pos.x(), pos.y()))
             else:
                 return None
         
         # Find closest segment
-        min_dist = float('inf')
+        px, py = scene_pos.x(), scene_pos.y()
+        threshold_sq = threshold * threshold
+        min_dist_sq = float('inf')
         closest_segment = None
         
         for i in range(len(positions) - 1):
-            p1 = positions[i]
-            p2 = positions[i + 1]
+            x1, y1 = positions[i]
+            x2, y2 = positions[i + 1]
             
-            # Calculate distance from point to line segment
-            dist = self._point_to_segment_distance(scene_pos, p1, p2)
+            # Calculate squared distance from point to line segment
+            dist_sq = self._point_to_segment_distance_sq(px, py, x1, y1, x2, y2)
             
-            if dist < min_dist and dist <= threshold:
-                min_dist = dist
+            if dist_sq < min_dist_sq and dist_sq <= threshold_sq:
+                min_dist_sq = dist_sq
                 closest_segment = (i, system_chain[i], system_chain[i + 1])
         
         return closest_segment
     
-    def _point_to_segment_distance(self, point: QPointF, seg_start: QPointF, seg_end: QPointF) -> float:
-        """Calculate the shortest distance from a point to a line segment.
+    @staticmethod
+    def _point_to_segment_distance_sq(px: float, py: float,
+                                      x1: float, y1: float, x2: float, y2: float) -> float:
+        """Calculate the squared shortest distance from a point to a line segment.
         
         Args:
-            point: The point to measure from
-            seg_start: Start of the line segment
-            seg_end: End of the line segment
+            px, py: The point to measure from
+            x1, y1: Start of the line segment
+            x2, y2: End of the line segment
             
         Returns:
-            Distance from point to segment
+            Squared distance from point to segment
         """
-        # Vector from seg_start to seg_end
-        dx = seg_end.x() - seg_start.x()
-        dy = seg_end.y() - seg_start.y()
+        # Vector from segment start to segment end
+        dx = x2 - x1
+        dy = y2 - y1
         
-        if dx == 0 and dy == 0:
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
             # Segment is a point
-            return ((point.x() - seg_start.x()) ** 2 + (point.y() - seg_start.y()) ** 2) ** 0.5
+            return (px - x1) ** 2 + (py - y1) ** 2
         
         # Parameter t represents position along the segment (0 to 1)
-        t = max(0, min(1, ((point.x() - seg_start.x()) * dx + (point.y() - seg_start.y()) * dy) / (dx * dx + dy * dy)))
+        t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
         
-        # Closest point on segment
-        closest_x = seg_start.x() + t * dx
-        closest_y = seg_start.y() + t * dy
-        
-        # Distance from point to closest point
-        return ((point.x() - closest_x) ** 2 + (point.y() - closest_y) ** 2) ** 0.5
+        # Squared distance from point to closest point on segment
+        return (px - (x1 + t * dx)) ** 2 + (py - (y1 + t * dy)) ** 2
     
     def calculate_length(self) -> float:
         """Calculate the total length of this route in HSU.
@@ -493,11 +603,12 @@ class RouteItem(QGraphicsPathItem):
         """
         system_chain = self.route_data.get_system_chain()
         
-        # Get positions for all systems in chain
+        # Get positions for all systems in chain as plain (x, y) floats
         positions = []
         for sys_id in system_chain:
             if sys_id in self.system_items:
-                positions.append(self.system_items[sys_id].pos())
+                pos = self.system_items[sys_id].pos()
+                positions.append((pos.x(), pos.y()))
             else:
                 # System not found - can't calculate length
                 return 0.0
@@ -505,32 +616,19 @@ class RouteItem(QGraphicsPathItem):
         if len(positions) < 2:
             return 0.0
         
-        total_length = 0.0
-        
         # For simple 2-system routes with control points, calculate through control points
         if len(system_chain) == 2 and self.route_data.control_points:
-            # Start position
-            prev_pos = positions[0]
-            
-            # Add segments through control points
-            for x, y in self.route_data.control_points:
-                curr_pos = QPointF(x, y)
-                dx = curr_pos.x() - prev_pos.x()
-                dy = curr_pos.y() - prev_pos.y()
-                total_length += (dx * dx + dy * dy) ** 0.5
-                prev_pos = curr_pos
-            
-            # Add final segment to end system
-            dx = positions[1].x() - prev_pos.x()
-            dy = positions[1].y() - prev_pos.y()
-            total_length += (dx * dx + dy * dy) ** 0.5
+            points = [positions[0], *self.route_data.control_points, positions[1]]
         else:
             # For chain routes, sum system-to-system distances
-            for i in range(len(positions) - 1):
-                p1 = positions[i]
-                p2 = positions[i + 1]
-                dx = p2.x() - p1.x()
-                dy = p2.y() - p1.y()
-                total_length += (dx * dx + dy * dy) ** 0.5
+            points = positions
+        
+        total_length = 0.0
+        x0, y0 = points[0]
+        for x1, y1 in points[1:]:
+            dx = x1 - x0
+            dy = y1 - y0
+            total_length += (dx * dx + dy * dy) ** 0.5
+            x0, y0 = x1, y1
         
         return total_length
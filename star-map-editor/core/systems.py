@@ -4,17 +4,42 @@ This module handles star system data structures and graphics representation
 for the Star Map Editor.
 """
 
-import uuid
-from dataclasses import dataclass, field
-from PySide6.QtCore import QPointF, Qt
+import itertools
+import os
+import sys
+from math import ceil, log2
+from collections.abc import Iterable
+from dataclasses import dataclass
+from PySide6.QtCore import QPointF, QRectF, Qt
 from PySide6.QtWidgets import (
-    QGraphicsEllipseItem, QGraphicsTextItem, QDialog, 
+    QGraphicsItem, QDialog, QStyle, QStyleOptionGraphicsItem,
     QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel
 )
-from PySide6.QtGui import QColor, QPen, QBrush, QFont
+from PySide6.QtGui import (
+    QColor, QPen, QFont, QPainter, QPainterPath, QPixmap, QStaticText, QTransform
+)
+
+
+# System IDs are "<session seed>-<counter>": the random per-process seed
+# keeps IDs from different editing sessions apart, the counter makes each
+# new ID cheap
+_ID_SEED = os.urandom(16).hex()  # 128 bits, as many as the uuid4 it replaces
+_ID_COUNTER = itertools.count(1)
+
+
+def intern_ids(ids: Iterable[str]) -> tuple[str, ...]:
+    """Convert goods/facility IDs to a tuple of interned strings.
+    
+    The same few IDs repeat across every system; interning makes them
+    share one string object each.
+    
+    Args:
+        ids: Good or facility IDs
+    """
+    return tuple(sys.intern(i) for i in ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemData:
     """Data model for a star system.
     
@@ -25,38 +50,47 @@ class SystemData:
     - Icon size changes
     
     Attributes:
-        id: Unique identifier for the system (UUID string)
+        id: Unique identifier for the system ("<random session seed>-<hex counter>";
+            older projects use random hex or UUID strings)
         name: Display name of the system
         position: Position in WORLD SPACE (HSU coordinates as QPointF)
         population_id: Population level identifier (from population_levels.json)
-        imports: List of imported goods IDs (from goods.json)
-        exports: List of exported goods IDs (from goods.json)
-        facilities: List of facility IDs (from facility_flags.json)
+        imports: Tuple of imported goods IDs (from goods.json)
+        exports: Tuple of exported goods IDs (from goods.json)
+        facilities: Tuple of facility IDs (from facility_flags.json)
+    
+    ID tuples passed to the constructor are interned; assign new ones
+    through intern_ids().
     """
     id: str
     name: str
     position: QPointF
     population_id: str | None = None
-    imports: list[str] = field(default_factory=list)
-    exports: list[str] = field(default_factory=list)
-    facilities: list[str] = field(default_factory=list)
+    imports: tuple[str, ...] = ()
+    exports: tuple[str, ...] = ()
+    facilities: tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        self.imports = intern_ids(self.imports)
+        self.exports = intern_ids(self.exports)
+        self.facilities = intern_ids(self.facilities)
     
     @classmethod
     def create_new(cls, name: str, position: QPointF):
-        """Create a new system with a generated UUID.
+        """Create a new system with a newly generated ID.
         
         Args:
             name: Display name for the system
             position: Position in WORLD SPACE (HSU coordinates)
         """
         return cls(
-            id=str(uuid.uuid4()),
+            id=f"{_ID_SEED}-{next(_ID_COUNTER):x}",
             name=name,
             position=position
         )
 
 
-class SystemItem(QGraphicsEllipseItem):
+class SystemItem(QGraphicsItem):
     """Graphics representation of a star system.
     
     UI SPACE ARCHITECTURE:
@@ -67,6 +101,10 @@ class SystemItem(QGraphicsEllipseItem):
     
     Displays as a colored circle with the system name as a label.
     Supports selection, dragging, and position updates.
+    
+    The circle is drawn from a pixmap shared by all systems with the same
+    radius and selection state, so items carry no pen/brush/rect state of
+    their own.
     """
     
     # Visual configuration (UI SPACE)
@@ -79,6 +117,16 @@ class SystemItem(QGraphicsEllipseItem):
     NORMAL_COLOR = QColor(100, 150, 255)  # Blue for normal state
     SELECTED_COLOR = QColor(255, 200, 100)  # Orange for selected state
     BORDER_WIDTH = 2
+    LABEL_MARGIN = 4  # Inset of the label text, as a QGraphicsTextItem document margin
+    MAX_PIXMAP_SCALE = 16  # Largest device scale a circle pixmap is rendered at
+    MIN_VISIBLE_RADIUS = 0.75  # On-screen radius in pixels below which only a dot is painted
+    _LABEL_FONT = None  # Shared label QFont, created on first use (needs a QApplication)
+    # Shared pens: the circle border and the two-tone selection outline
+    _BORDER_PEN = QPen(Qt.white, BORDER_WIDTH)
+    _OUTLINE_PEN = QPen(Qt.white, 0, Qt.SolidLine)
+    _OUTLINE_DASH_PEN = QPen(Qt.black, 0, Qt.DashLine)
+    _DEFAULT_LABEL_COLOR = QColor(Qt.white)  # Shared until set_label_color() is called
+    _pixmap_cache = {}  # Circle pixmaps keyed by (radius, selected, scale)
     
     def __init__(self, system_data: SystemData, parent=None):
         """Initialize the system graphics item.
@@ -89,40 +137,161 @@ class SystemItem(QGraphicsEllipseItem):
         """
         super().__init__(parent)
         self.system_data = system_data
+        self._label_rect = QRectF()  # Label area, part of boundingRect() and shape()
+        self._shape = QPainterPath()  # Hit-test shape: circle plus label
+        self._dragging = False  # True while this item is dragged with the mouse
         
-        # Use current global radius setting
+        # Use current global radius setting (UI SPACE: visual size only)
         self.current_radius = SystemItem.RADIUS
-        
-        # Set up the circle (UI SPACE: visual size only)
-        self.setRect(-self.current_radius, -self.current_radius, 
-                     self.current_radius * 2, self.current_radius * 2)
+        self._circle_rect = self._outer_rect(self.current_radius)
+        self._bounding_rect = QRectF(self._circle_rect)
         # WORLD SPACE: position stays in HSU coordinates
         self.setPos(system_data.position)
         
-        # Configure appearance
-        self.setPen(QPen(Qt.white, self.BORDER_WIDTH))
-        self.setBrush(QBrush(self.NORMAL_COLOR))
-        
         # Enable interaction
-        self.setFlag(QGraphicsEllipseItem.ItemIsMovable, True)
-        self.setFlag(QGraphicsEllipseItem.ItemIsSelectable, True)
-        self.setFlag(QGraphicsEllipseItem.ItemSendsGeometryChanges, True)
+        self.setFlag(QGraphicsItem.ItemIsMovable, True)
+        self.setFlag(QGraphicsItem.ItemIsSelectable, True)
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         
-        # Create name label
-        self.label = QGraphicsTextItem(parent=self)
-        self.label.setPlainText(system_data.name)
-        self.label.setDefaultTextColor(Qt.white)
+        # Cache the rendered circle and label; they are only re-rasterized
+        # when the selection, size, name or zoom level changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
-        # Position label to the right of the circle
-        font = QFont()
-        font.setPointSize(10)
-        font.setBold(True)
-        self.label.setFont(font)
-        self.update_label_position()
+        # Name label, drawn in paint() from a pre-laid-out QStaticText
+        # instead of a child QGraphicsTextItem with its own QTextDocument
+        self._label_color = self._DEFAULT_LABEL_COLOR
+        self._label_text = QStaticText()
+        self._label_text.setTextFormat(Qt.PlainText)
+        self._set_label_text(system_data.name)
+    
+    @classmethod
+    def _outer_rect(cls, radius: float) -> QRectF:
+        """Get the circle's extent including its border stroke."""
+        extent = radius + cls.BORDER_WIDTH / 2
+        return QRectF(-extent, -extent, extent * 2, extent * 2)
+    
+    @classmethod
+    def _circle_pixmap(cls, radius: float, selected: bool, scale: float) -> QPixmap:
+        """Get the shared circle pixmap for a radius, state and device scale.
         
-        # Make label non-interactive
-        self.label.setFlag(QGraphicsTextItem.ItemIsMovable, False)
-        self.label.setFlag(QGraphicsTextItem.ItemIsSelectable, False)
+        Args:
+            radius: Circle radius in scene units
+            selected: Whether to use the selected fill color
+            scale: Device pixels per scene unit, rounded to a power of two
+        """
+        key = (radius, selected, scale)
+        pixmap = cls._pixmap_cache.get(key)
+        if pixmap is None:
+            outer = cls._outer_rect(radius)
+            size = max(1, ceil(outer.width() * scale))
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.scale(scale, scale)
+            painter.translate(-outer.left(), -outer.top())
+            painter.setPen(cls._BORDER_PEN)
+            painter.setBrush(cls.SELECTED_COLOR if selected else cls.NORMAL_COLOR)
+            painter.drawEllipse(QPointF(0, 0), radius, radius)
+            painter.end()
+            cls._pixmap_cache[key] = pixmap
+        return pixmap
+    
+    @classmethod
+    def _label_font(cls) -> QFont:
+        """Get the font shared by all system labels, creating it on first use."""
+        if cls._LABEL_FONT is None:
+            font = QFont()
+            font.setPointSize(10)
+            font.setBold(True)
+            cls._LABEL_FONT = font
+        return cls._LABEL_FONT
+    
+    def _set_label_text(self, text: str):
+        """Lay out new label text and update the item's geometry."""
+        self.prepareGeometryChange()
+        self._label_text.setText(text)
+        self._label_text.prepare(QTransform(), self._label_font())
+        self._update_label_rect()
+    
+    def _update_label_rect(self):
+        """Place the label to the right of the circle."""
+        size = self._label_text.size()
+        self._label_rect = QRectF(self.current_radius + 5 + self.LABEL_MARGIN,
+                                  -self.current_radius + self.LABEL_MARGIN,
+                                  size.width(), size.height())
+        self._bounding_rect = self._circle_rect.united(self._label_rect)
+        # Clicking the name hits the system, as the child label item did
+        shape = QPainterPath()
+        shape.setFillRule(Qt.WindingFill)
+        shape.addEllipse(self._circle_rect)
+        shape.addRect(self._label_rect)
+        self._shape = shape
+    
+    def set_label_color(self, color):
+        """Set the label text color (e.g. to follow the light/dark theme).
+        
+        Args:
+            color: New label color (QColor or Qt.GlobalColor). A QColor is
+                shared rather than copied, so callers can pass one color to
+                every system.
+        """
+        self._label_color = color if isinstance(color, QColor) else QColor(color)
+        self.update()
+    
+    def rect(self) -> QRectF:
+        """Return the circle's rectangle in item coordinates."""
+        radius = self.current_radius
+        return QRectF(-radius, -radius, radius * 2, radius * 2)
+    
+    def boundingRect(self) -> QRectF:
+        """Return the circle's bounds extended to cover the label."""
+        return self._bounding_rect
+    
+    def shape(self) -> QPainterPath:
+        """Return the circle and the label area as the hit-test shape."""
+        return self._shape
+    
+    def paint(self, painter, option, widget=None):
+        """Paint the circle, its selection outline and the name label."""
+        transform = painter.worldTransform()
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(transform)
+        if lod * self.current_radius < self.MIN_VISIBLE_RADIUS:
+            # Zoomed out so far the circle is sub-pixel; paint a single
+            # device pixel dot so the system stays visible, and skip the label
+            half = 0.5 / lod
+            color = self.SELECTED_COLOR if self.isSelected() else self.NORMAL_COLOR
+            painter.fillRect(QRectF(-half, -half, 2 * half, 2 * half), color)
+            return
+        
+        # Render the pixmap at (a power of two above) the device resolution
+        # so circles stay crisp when zoomed in
+        device_scale = max(lod, 1.0)
+        scale = min(2 ** ceil(log2(device_scale)), self.MAX_PIXMAP_SCALE)
+        selected = self.isSelected()
+        pixmap = self._circle_pixmap(self.current_radius, selected, scale)
+        # The circle's edge was antialiased once when the pixmap was
+        # rendered; blitting it and the hairline outline needs no AA
+        antialiased = painter.testRenderHint(QPainter.Antialiasing)
+        if antialiased:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.drawPixmap(self._circle_rect, pixmap, QRectF(pixmap.rect()))
+        
+        if option.state & QStyle.StateFlag.State_Selected:
+            # Outline the circle only, not the label
+            rect = self.rect()
+            painter.setBrush(Qt.NoBrush)
+            painter.setPen(self._OUTLINE_PEN)
+            painter.drawRect(rect)
+            painter.setPen(self._OUTLINE_DASH_PEN)
+            painter.drawRect(rect)
+        
+        painter.setFont(self._label_font())
+        painter.setPen(self._label_color)
+        painter.drawStaticText(self._label_rect.topLeft(), self._label_text)
+        
+        if antialiased:
+            painter.setRenderHint(QPainter.Antialiasing, True)
     
     def set_icon_size(self, radius: float):
         """Update the icon size (UI SPACE only).
@@ -132,15 +301,11 @@ class SystemItem(QGraphicsEllipseItem):
         Args:
             radius: New radius for the icon
         """
+        self.prepareGeometryChange()
         self.current_radius = radius
-        # Update the ellipse rect (UI SPACE)
-        self.setRect(-radius, -radius, radius * 2, radius * 2)
+        self._circle_rect = self._outer_rect(radius)
         # Update label position to match new size
-        self.update_label_position()
-    
-    def update_label_position(self):
-        """Update label position based on current icon size."""
-        self.label.setPos(self.current_radius + 5, -self.current_radius)
+        self._update_label_rect()
     
     def update_name(self, name: str):
         """Update the system name and label.
@@ -149,7 +314,44 @@ class SystemItem(QGraphicsEllipseItem):
             name: New name for the system
         """
         self.system_data.name = name
-        self.label.setPlainText(name)
+        self._set_label_text(name)
+    
+    def mousePressEvent(self, event):
+        """Start deferring data model updates until the drag ends."""
+        super().mousePressEvent(event)
+        self._dragging = True
+    
+    def mouseReleaseEvent(self, event):
+        """Write the final drag position to the data model."""
+        super().mouseReleaseEvent(event)
+        self.end_drag()
+    
+    def end_drag(self):
+        """Finish a mouse drag, writing the final position to the data model.
+        
+        Called from mouseReleaseEvent, and by the view when it takes the
+        release for panning so the item never sees it.
+        """
+        if self._dragging:
+            self._dragging = False
+            self._store_position()
+    
+    def _on_position_changed(self, value):
+        """Update the data model when position changes, unless dragging."""
+        if not self._dragging:
+            self._store_position()
+    
+    def _store_position(self):
+        """Update the data model from the item position."""
+        self.system_data.position = self.pos()
+    
+    # itemChange handlers keyed by change type. Qt calls itemChange for every
+    # move while dragging; a dict probe on a prebuilt key avoids looking up
+    # the enum members on every call. Selection needs no handler: Qt
+    # repaints the item and paint() picks the pixmap from isSelected().
+    _ITEM_CHANGE_HANDLERS = {
+        QGraphicsItem.ItemPositionHasChanged: _on_position_changed,
+    }
     
     def itemChange(self, change, value):
         """Handle item changes, particularly position updates.
@@ -161,15 +363,9 @@ class SystemItem(QGraphicsEllipseItem):
         Returns:
             The processed value
         """
-        if change == QGraphicsEllipseItem.ItemPositionHasChanged:
-            # Update the data model when position changes
-            self.system_data.position = self.pos()
-        elif change == QGraphicsEllipseItem.ItemSelectedHasChanged:
-            # Update visual appearance when selection changes
-            if self.isSelected():
-                self.setBrush(QBrush(self.SELECTED_COLOR))
-            else:
-                self.setBrush(QBrush(self.NORMAL_COLOR))
+        handler = self._ITEM_CHANGE_HANDLERS.get(change)
+        if handler is not None:
+            handler(self, value)
         
         return super().itemChange(change, value)
     
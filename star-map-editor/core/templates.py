@@ -3,13 +3,84 @@
 This module handles template graphics representation and interaction.
 """
 
-from PySide6.QtCore import Qt, QRectF
+from typing import Optional, Tuple
+
+from PySide6.QtCore import Qt, QObject, QPointF, QRectF, QRunnable, QSize, QThreadPool, Signal
 from PySide6.QtWidgets import QGraphicsPixmapItem
-from PySide6.QtGui import QPixmap, QPainter
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPainter, QTransform
 
 from .project_model import TemplateData
 
 
+# Longest side, in pixels, a template image is decoded at. Larger images
+# are downscaled while decoding instead of holding a full-size buffer.
+MAX_TEMPLATE_IMAGE_SIZE = 4096
+
+
+def read_template_image(filepath: str) -> Tuple[QImage, QSize]:
+    """Decode a template image, downscaled to MAX_TEMPLATE_IMAGE_SIZE if larger.
+    
+    The original size is returned with the image, so TemplateItem can
+    stretch a downscaled image back to it and the template keeps its size
+    in the scene. Uses QImage only, so it is safe to call from a worker
+    thread.
+    
+    Args:
+        filepath: Path to the image file
+        
+    Returns:
+        (image, source_size): the decoded image, or a null QImage if the
+        file can't be read, and the image's size in the file (invalid if
+        the reader can't report it)
+    """
+    reader = QImageReader(filepath)
+    size = reader.size()
+    if size.isValid() and max(size.width(), size.height()) > MAX_TEMPLATE_IMAGE_SIZE:
+        reader.setScaledSize(size.scaled(MAX_TEMPLATE_IMAGE_SIZE, MAX_TEMPLATE_IMAGE_SIZE,
+                                         Qt.KeepAspectRatio))
+    return reader.read(), size
+
+
+class _TemplateImageTask(QRunnable):
+    """Decodes a template image on a QThreadPool worker."""
+    
+    def __init__(self, key: str, filepath: str, loader: 'TemplateImageLoader'):
+        super().__init__()
+        self.key = key
+        self.filepath = filepath
+        self.loader = loader
+    
+    def run(self):
+        """Decode the image and hand it back to the GUI thread."""
+        image, source_size = read_template_image(self.filepath)
+        try:
+            self.loader.image_loaded.emit(self.key, image, source_size)
+        except RuntimeError:
+            # The loader went away (e.g. application shutdown) mid-decode
+            pass
+
+
+class TemplateImageLoader(QObject):
+    """Decodes template images off the GUI thread.
+    
+    image_loaded is emitted on the GUI thread with the key passed to load(),
+    the decoded QImage (null if the file can't be read) and the image's
+    size in the file (see read_template_image).
+    """
+    
+    image_loaded = Signal(str, QImage, QSize)  # (key, image, source_size)
+    
+    def load(self, key: str, filepath: str):
+        """Start decoding an image on the global thread pool.
+        
+        Args:
+            key: Identifies the request in image_loaded (e.g. a template ID),
+                so the same file can be loaded more than once
+            filepath: Path to the image file
+        """
+        QThreadPool.globalInstance().start(_TemplateImageTask(key, filepath, self))
+
+
 class TemplateItem(QGraphicsPixmapItem):
     """Graphics representation of a template image.
     
@@ -27,24 +98,41 @@ class TemplateItem(QGraphicsPixmapItem):
     - Selection for editing
     """
     
-    def __init__(self, template_data: TemplateData, parent=None):
+    def __init__(self, template_data: TemplateData, parent=None, image: Optional[QImage] = None,
+                 source_size: Optional[QSize] = None):
         """Initialize the template graphics item.
         
         Args:
             template_data: The TemplateData object this item represents
             parent: Optional parent graphics item
+            image: Already decoded image (see TemplateImageLoader); read
+                from template_data.filepath when not given
+            source_size: Size of the image in its file, when image was
+                downscaled while decoding
         """
         super().__init__(parent)
         self.template_data = template_data
         
         # Load the pixmap (IMAGE LAYER)
-        pixmap = QPixmap(template_data.filepath)
+        if image is None:
+            image, source_size = read_template_image(template_data.filepath)
+        pixmap = QPixmap.fromImage(image)
         if pixmap.isNull():
             # Create a placeholder if image can't be loaded
             pixmap = QPixmap(100, 100)
             pixmap.fill(Qt.gray)
+        elif (source_size is not None and source_size.isValid()
+                and source_size != pixmap.size()):
+            # Stretch a downscaled image back to its original size on each
+            # axis, so the template covers the same scene area as the file.
+            # This base transform is separate from the template scale.
+            self.setTransform(QTransform.fromScale(
+                source_size.width() / pixmap.width(),
+                source_size.height() / pixmap.height()))
         
         self.setPixmap(pixmap)
+        # Center of the image in item coordinates; the pixmap never changes
+        self._origin = QPointF(pixmap.width() / 2, pixmap.height() / 2)
         
         # Apply stored transformations (IMAGE LAYER: visual only)
         self.setPos(template_data.position[0], template_data.position[1])
@@ -60,7 +148,12 @@ class TemplateItem(QGraphicsPixmapItem):
         self.setFlag(QGraphicsPixmapItem.ItemSendsGeometryChanges, True)
         
         # Set transform origin to center for scaling
-        self.setTransformOriginPoint(self.boundingRect().center())
+        self.setTransformOriginPoint(self._origin)
+        
+        # Cache the resampled image in device coordinates; it is only
+        # re-rendered when the template scale or view zoom changes, not on
+        # every repaint (e.g. while systems are dragged over it)
+        self.setCacheMode(QGraphicsPixmapItem.DeviceCoordinateCache)
     
     def update_lock_state(self):
         """Update interaction flags based on lock state."""
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for FacilityPopup's lazily filled category tabs.
+
+Runs against real widgets on Qt's offscreen platform.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path (star-map-editor/)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from core.data_loader import get_data_loader
+from core.gui import FacilityPopup
+
+
+def get_categories():
+    """Return the facility IDs of each category, in tab order."""
+    return list(get_data_loader().get_facility_categories().values())
+
+
+def test_only_current_tab_is_filled():
+    """Test that only the initially shown tab is filled on construction."""
+    print("Testing initial tab contents...")
+    categories = get_categories()
+    assert len(categories) >= 2, "Need at least two facility categories"
+
+    popup = FacilityPopup([])
+    assert popup._built_tabs == {0}
+    assert set(popup.facility_items) == set(categories[0])
+    assert popup.tab_widget.widget(0).count() == len(categories[0])
+    assert popup.tab_widget.widget(1).count() == 0
+    print("✓ Only the first tab is filled")
+
+
+def test_tab_filled_when_shown():
+    """Test that a tab is filled the first time it is shown, and only once."""
+    print("Testing tab activation...")
+    categories = get_categories()
+    selected = categories[1][0]
+
+    popup = FacilityPopup([selected])
+    popup.tab_widget.setCurrentIndex(1)
+    assert popup._built_tabs == {0, 1}
+    assert popup.tab_widget.widget(1).count() == len(categories[1])
+    assert popup.facility_items[selected].checkState() == Qt.Checked
+    print("✓ Tab filled with the selection applied")
+
+    popup.tab_widget.setCurrentIndex(0)
+    popup.tab_widget.setCurrentIndex(1)
+    assert popup.tab_widget.widget(1).count() == len(categories[1])
+    print("✓ Showing a tab again does not refill it")
+
+
+def test_selection_includes_unbuilt_tabs():
+    """Test that facilities on tabs never shown keep their selection."""
+    print("Testing selection across built and unbuilt tabs...")
+    categories = get_categories()
+    first, hidden = categories[0][0], categories[-1][0]
+
+    popup = FacilityPopup([first, hidden])
+    assert hidden not in popup.facility_items
+    assert popup.get_selected_facilities() == [first, hidden]
+    print("✓ Unbuilt tabs report the initial selection")
+
+    popup.facility_items[first].setCheckState(Qt.Unchecked)
+    assert popup.get_selected_facilities() == [hidden]
+    print("✓ Unchecking a built item removes it")
+
+
+def test_reset_selection():
+    """Test reusing the popup with another selection."""
+    print("Testing reset_selection...")
+    categories = get_categories()
+    first, hidden = categories[0][0], categories[-1][0]
+
+    popup = FacilityPopup([first])
+    popup.reset_selection([hidden])
+    assert popup.facility_items[first].checkState() == Qt.Unchecked
+    assert popup.get_selected_facilities() == [hidden]
+    print("✓ reset_selection updates built and unbuilt tabs")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("FACILITY POPUP TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_only_current_tab_is_filled()
+        test_tab_filled_when_shown()
+        test_selection_includes_unbuilt_tabs()
+        test_reset_selection()
+
+        print()
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print(f"❌ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for GoodsPopup's proxy-model search filter.
+
+Runs against real widgets on Qt's offscreen platform.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path (star-map-editor/)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from core.data_loader import get_data_loader
+from core.gui import GoodsPopup
+
+
+def visible_ids(popup):
+    """Return the IDs of the goods the filter lets through, in order."""
+    proxy = popup.proxy
+    return [proxy.index(row, 0).data(Qt.UserRole) for row in range(proxy.rowCount())]
+
+
+def test_filter_matches_names():
+    """Test that the search filters by name, case-insensitively."""
+    print("Testing name filter...")
+    goods = get_data_loader().get_goods()
+    popup = GoodsPopup([])
+    assert len(visible_ids(popup)) == len(goods)
+
+    popup.search_input.setText("GAS")
+    expected = [good["id"] for good in goods if "gas" in good["name"].lower()]
+    assert expected, "Need at least one good named like 'gas'"
+    assert visible_ids(popup) == expected
+    print("✓ Filter is case-insensitive")
+
+    popup.search_input.setText("Tier")
+    assert visible_ids(popup) == []
+    print("✓ Filter ignores the tier suffix of the display text")
+
+    popup.search_input.clear()
+    assert len(visible_ids(popup)) == len(goods)
+    print("✓ Clearing the search shows every good")
+
+
+def test_selection_survives_filter():
+    """Test that checked goods hidden by the filter stay selected."""
+    print("Testing selection while filtered...")
+    goods = get_data_loader().get_goods()
+    hidden, shown = goods[0], goods[1]
+
+    popup = GoodsPopup([hidden["id"]])
+    popup.search_input.setText(shown["name"])
+    assert hidden["id"] not in visible_ids(popup)
+    assert popup.get_selected_goods() == [hidden["id"]]
+    print("✓ Hidden goods stay selected")
+
+    index = popup.proxy.index(visible_ids(popup).index(shown["id"]), 0)
+    popup.proxy.setData(index, Qt.Checked, Qt.CheckStateRole)
+    assert popup.get_selected_goods() == [hidden["id"], shown["id"]]
+    print("✓ Checking through the proxy updates the model")
+
+
+def test_reset_selection():
+    """Test reusing the popup with another selection and mode."""
+    print("Testing reset_selection...")
+    goods = get_data_loader().get_goods()
+
+    popup = GoodsPopup([goods[0]["id"]], "imports")
+    popup.search_input.setText(goods[0]["name"])
+    popup.reset_selection([goods[1]["id"]], "exports")
+    assert popup.search_input.text() == ""
+    assert len(visible_ids(popup)) == len(goods)
+    assert popup.get_selected_goods() == [goods[1]["id"]]
+    assert popup.windowTitle() == "Edit Exports"
+    print("✓ reset_selection clears the search and applies the new selection")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("GOODS POPUP TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_filter_matches_names()
+        test_selection_survives_filter()
+        test_reset_selection()
+
+        print()
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print(f"❌ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -62,18 +62,22 @@ def test_point_to_segment_distance():
         # Create mock systems (we won't actually use them in this test)
         system_dict = {}
         
-        # We can't instantiate RouteItem without a proper scene, but we can test the math
-        # Let's test the distance formula directly
+        # We can't instantiate RouteItem without a proper scene, but the
+        # distance formula is a static method we can test directly
+        distance_sq = RouteItem._point_to_segment_distance_sq
         
         # Test case: point above middle of horizontal line
-        p1 = QPointF(0, 0)
-        p2 = QPointF(100, 0)
-        test_point = QPointF(50, 50)
-        
-        # Calculate manually
         # The perpendicular distance should be 50 (the y-coordinate)
+        assert distance_sq(50, 50, 0, 0, 100, 0) == 2500, "Perpendicular distance should be 50"
+        
+        # Points past either end measure to the nearest endpoint
+        assert distance_sq(-30, 40, 0, 0, 100, 0) == 2500, "Distance should be 50 to the start"
+        assert distance_sq(103, 4, 0, 0, 100, 0) == 25, "Distance should be 5 to the end"
+        
+        # A zero-length segment behaves like a point
+        assert distance_sq(3, 4, 0, 0, 0, 0) == 25, "Distance should be 5 to the point"
         
-        print("✓ Point-to-segment distance logic can be tested (requires graphics context)")
+        print("✓ Point-to-segment squared distance is correct")
         return True
     except Exception as e:
         print(f"✗ Distance calculation test failed: {e}")
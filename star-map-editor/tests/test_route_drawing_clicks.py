@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for MapView's click handling while drawing routes.
+
+Each click is hit-tested once; clicks on a system's circle or its name
+label must both count as clicks on the system. Runs against a real view
+on Qt's offscreen platform.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path (star-map-editor/)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QGraphicsScene
+
+app = QApplication.instance() or QApplication([])
+
+from core.gui import MapView
+from core.systems import SystemData, SystemItem
+
+
+def create_view():
+    """Create a routes-mode view with one system at the scene origin.
+
+    Returns:
+        (view, system_item, started, finished): started and finished
+        collect the items emitted by the route drawing signals
+    """
+    scene = QGraphicsScene()
+    scene.setSceneRect(QRectF(-400, -300, 800, 600))
+    system_item = SystemItem(SystemData.create_new("Alpha", QPointF(0, 0)))
+    scene.addItem(system_item)
+
+    view = MapView(scene)
+    scene.setParent(view)  # Keep the scene alive as long as the view
+    view.resize(800, 600)
+    view.centerOn(0, 0)
+    view.routes_mode_active = True
+
+    started, finished = [], []
+    view.start_route_drawing.connect(started.append)
+    view.finish_route_drawing.connect(finished.append)
+    return view, system_item, started, finished
+
+
+def click(view, scene_pos):
+    """Send a left button press at a scene position."""
+    pos = QPointF(view.mapFromScene(scene_pos))
+    event = QMouseEvent(QEvent.MouseButtonPress, pos, view.mapToGlobal(pos),
+                        Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+    view.mousePressEvent(event)
+
+
+def label_center(system_item):
+    """Return the scene position of the center of a system's label."""
+    return system_item.mapToScene(system_item._label_rect.center())
+
+
+def test_click_starts_route():
+    """Test that clicking a system's circle or label starts a route."""
+    print("Testing route start...")
+    view, system_item, started, _ = create_view()
+
+    click(view, QPointF(0, 0))
+    assert started == [system_item]
+    print("✓ Clicking the circle starts a route")
+
+    click(view, label_center(system_item))
+    assert started == [system_item, system_item]
+    print("✓ Clicking the label starts a route")
+
+    click(view, QPointF(-300, -200))
+    assert len(started) == 2
+    print("✓ Clicking empty space does nothing")
+
+
+def test_click_finishes_route():
+    """Test clicks while a route is being drawn."""
+    print("Testing route drawing...")
+    view, system_item, started, finished = create_view()
+    view.route_drawing_active = True
+
+    click(view, QPointF(-300, -200))
+    assert finished == [] and len(view.route_drawing_points) == 1
+    print("✓ Clicking empty space adds a control point")
+
+    click(view, label_center(system_item))
+    assert finished == [system_item] and started == []
+    print("✓ Clicking a label finishes the route at that system")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("ROUTE DRAWING CLICK TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_click_starts_route()
+        test_click_finishes_route()
+
+        print()
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print(f"❌ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
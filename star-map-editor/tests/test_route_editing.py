@@ -23,7 +23,10 @@ class MockQPointF:
         return self._y
 
 class MockQt:
-    pass
+    white = 'white'
+    black = 'black'
+    SolidLine = 'SolidLine'
+    DashLine = 'DashLine'
 
 # Create mock modules
 pyside6_module = type(sys)('PySide6')
@@ -37,6 +40,10 @@ qtcore_module.Qt = MockQt
 qtcore_module.Signal = lambda *a: None
 qtcore_module.QRectF = object
 qtcore_module.QTimer = object
+qtcore_module.QObject = object
+qtcore_module.QRunnable = object
+qtcore_module.QThreadPool = object
+qtcore_module.QSize = object
 
 qtwidgets_module.QGraphicsEllipseItem = object
 qtwidgets_module.QGraphicsTextItem = object
@@ -48,21 +55,35 @@ qtwidgets_module.QPushButton = object
 qtwidgets_module.QLabel = object
 qtwidgets_module.QGraphicsPathItem = object
 qtwidgets_module.QGraphicsPixmapItem = object
+qtwidgets_module.QGraphicsItem = type('QGraphicsItem', (), {
+    'ItemPositionHasChanged': 'ItemPositionHasChanged',
+    'ItemSelectedHasChanged': 'ItemSelectedHasChanged',
+})
+qtwidgets_module.QStyle = object
+qtwidgets_module.QStyleOptionGraphicsItem = object
 
 qtgui_module.QColor = lambda *a, **k: None
 qtgui_module.QPen = lambda *a, **k: None
 qtgui_module.QBrush = lambda *a, **k: None
 qtgui_module.QFont = lambda *a, **k: None
-qtgui_module.QPainterPath = type('QPainterPath', (), {'moveTo': lambda *a: None, 'lineTo': lambda *a: None})
+qtgui_module.QPainterPath = type('QPainterPath', (), {'moveTo': lambda *a: None, 'lineTo': lambda *a: None, 'addPolygon': lambda *a: None})
+qtgui_module.QPolygonF = lambda *a, **k: None
 qtgui_module.QPixmap = object
+qtgui_module.QImage = object
+qtgui_module.QImageReader = object
 qtgui_module.QPainter = object
 qtgui_module.QTransform = object
+qtgui_module.QStaticText = object
 
-# Install mocks
-sys.modules['PySide6'] = pyside6_module
-sys.modules['PySide6.QtCore'] = qtcore_module
-sys.modules['PySide6.QtWidgets'] = qtwidgets_module
-sys.modules['PySide6.QtGui'] = qtgui_module
+# Install mocks only if PySide6 is missing; when the whole suite runs under
+# pytest, replacing the real modules would break the tests that use widgets
+try:
+    import PySide6.QtWidgets
+except ImportError:
+    sys.modules['PySide6'] = pyside6_module
+    sys.modules['PySide6.QtCore'] = qtcore_module
+    sys.modules['PySide6.QtWidgets'] = qtwidgets_module
+    sys.modules['PySide6.QtGui'] = qtgui_module
 
 # Now import our modules
 from core.routes import RouteData
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for route group label updates.
+
+Labels are re-centered only for groups whose routes changed; this checks
+that system moves, route edits and refreshes reach the right labels.
+Runs against a real editor window on Qt's offscreen platform.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path (star-map-editor/)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QPointF
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from core.gui import StarMapEditor
+from core.project_model import RouteGroup
+from core.routes import RouteData
+from core.systems import SystemData
+
+
+def add_system(editor, name, x, y):
+    """Add a system to the editor's project and scene, returning its ID."""
+    system = SystemData.create_new(name, QPointF(x, y))
+    editor.project.systems[system.id] = system
+    editor.add_system_to_scene(system)
+    return system.id
+
+
+def add_grouped_route(editor, name, system_ids):
+    """Add a route through the given systems in a group of its own.
+
+    Returns:
+        (route_item, group_id)
+    """
+    route = RouteData.create_new(name, system_ids[0], system_ids[-1])
+    route.set_system_chain(list(system_ids))
+    editor.project.routes[route.id] = route
+    route_item = editor.add_route_to_scene(route)
+    group = RouteGroup.create_new(f"{name} Group", [route.id])
+    editor.project.route_groups[group.id] = group
+    return route_item, group.id
+
+
+def create_editor():
+    """Create an editor with two separate grouped routes.
+
+    Returns:
+        (editor, first, second): first and second are (system_ids,
+        route_item, group_id) for each route
+    """
+    editor = StarMapEditor()
+    routes = []
+    for name, y in (("North", 0), ("South", 500)):
+        system_ids = [add_system(editor, f"{name} {i}", x, y)
+                      for i, x in enumerate((0, 100, 300))]
+        routes.append((system_ids, *add_grouped_route(editor, name, system_ids)))
+    editor.rebuild_route_group_labels()
+    return editor, routes[0], routes[1]
+
+
+def track_center_calls(editor):
+    """Record the group of every calculate_route_group_center() call."""
+    calls = []
+    calculate = editor.calculate_route_group_center
+
+    def tracked(route_group):
+        calls.append(route_group.id)
+        return calculate(route_group)
+
+    editor.calculate_route_group_center = tracked
+    return calls
+
+
+def test_system_move_updates_only_moved_groups():
+    """Test that moving a system re-centers only its routes' group labels."""
+    print("Testing system movement...")
+    editor, (north_ids, _, north_group), (_, _, south_group) = create_editor()
+    north_label = editor.route_group_labels[north_group]
+    south_label = editor.route_group_labels[south_group]
+    north_x, south_pos = north_label.pos().x(), south_label.pos()
+    calls = track_center_calls(editor)
+
+    editor.system_items[north_ids[2]].setPos(500, 0)
+    editor.update_routes_for_system_movement()
+    assert calls == [north_group], calls
+    assert north_label.pos().x() == north_x + 100
+    assert south_label.pos() == south_pos
+    print("✓ Only the moved route's group label is re-centered")
+
+    calls.clear()
+    editor.update_routes_for_system_movement()
+    assert calls == []
+    print("✓ No labels are touched when nothing moved")
+
+
+def test_route_edit_updates_label():
+    """Test that editing a route's system chain re-centers its group label."""
+    print("Testing route edits...")
+    editor, (north_ids, north_item, north_group), (_, _, south_group) = create_editor()
+    north_label = editor.route_group_labels[north_group]
+    north_x = north_label.pos().x()
+    calls = track_center_calls(editor)
+
+    editor.selected_route = north_item
+    editor.remove_system_from_route_by_id(north_ids[2])
+    assert calls == [north_group], calls
+    # The route's midpoint moves from x=150 to x=50
+    assert north_label.pos().x() == north_x - 100
+    print("✓ Removing a system re-centers the route's group label")
+
+
+def test_refresh_updates_labels():
+    """Test that refreshing items after a data change re-centers labels."""
+    print("Testing refresh_all_items...")
+    editor, (north_ids, _, north_group), _ = create_editor()
+    north_label = editor.route_group_labels[north_group]
+    north_x = north_label.pos().x()
+
+    for system_id in north_ids:
+        system = editor.project.systems[system_id]
+        system.position = QPointF(system.position.x() * 2, system.position.y())
+    editor.refresh_all_items()
+    # The route's midpoint moves from x=150 to x=300
+    assert north_label.pos().x() == north_x + 150
+    print("✓ refresh_all_items re-centers the labels")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("ROUTE GROUP LABEL TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_system_move_updates_only_moved_groups()
+        test_route_edit_updates_label()
+        test_refresh_updates_labels()
+
+        print()
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print(f"❌ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for template image decoding and sizing.
+
+Runs against real images on Qt's offscreen platform.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path (star-map-editor/)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+app = QApplication.instance() or QApplication([])
+
+from core import templates
+from core.project_model import TemplateData
+from core.templates import TemplateItem, read_template_image
+
+
+def write_image(directory, width, height):
+    """Write a PNG of the given size and return its path."""
+    path = os.path.join(directory, f"template_{width}x{height}.png")
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(Qt.darkBlue)
+    assert image.save(path)
+    return path
+
+
+def test_read_small_image():
+    """Test that images within the size limit are decoded at full size."""
+    print("Testing small image...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_image(directory, 300, 200)
+        image, source_size = read_template_image(path)
+    assert image.size() == QSize(300, 200)
+    assert source_size == QSize(300, 200)
+    print("✓ Decoded at full size")
+
+
+def test_read_large_image():
+    """Test that oversized images are downscaled, keeping their aspect ratio."""
+    print("Testing oversized image...")
+    old_max = templates.MAX_TEMPLATE_IMAGE_SIZE
+    templates.MAX_TEMPLATE_IMAGE_SIZE = 100
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_image(directory, 500, 300)
+            image, source_size = read_template_image(path)
+    finally:
+        templates.MAX_TEMPLATE_IMAGE_SIZE = old_max
+    assert image.size() == QSize(100, 60), image.size()
+    assert source_size == QSize(500, 300)
+    print("✓ Downscaled to the limit, source size reported")
+
+
+def test_read_missing_image():
+    """Test that an unreadable file gives a null image and invalid size."""
+    print("Testing missing image...")
+    with tempfile.TemporaryDirectory() as directory:
+        image, source_size = read_template_image(os.path.join(directory, "missing.png"))
+    assert image.isNull()
+    assert not source_size.isValid()
+    print("✓ Null image and invalid size")
+
+
+def test_item_keeps_source_size():
+    """Test that a downscaled template covers its source size in the scene."""
+    print("Testing TemplateItem size...")
+    old_max = templates.MAX_TEMPLATE_IMAGE_SIZE
+    # Downscaling 5000x3000 to 997 wide rounds the height to 598, so the
+    # two axes need different stretch factors to restore the exact size
+    templates.MAX_TEMPLATE_IMAGE_SIZE = 997
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_image(directory, 5000, 3000)
+            image, source_size = read_template_image(path)
+            item = TemplateItem(TemplateData.create_new(path), image=image,
+                                source_size=source_size)
+            from_file = TemplateItem(TemplateData.create_new(path))
+    finally:
+        templates.MAX_TEMPLATE_IMAGE_SIZE = old_max
+    assert image.size() == QSize(997, 598), image.size()
+
+    rect = item.mapRectToScene(QRectF(item.pixmap().rect()))
+    assert abs(rect.width() - 5000) < 1e-6, rect
+    assert abs(rect.height() - 3000) < 1e-6, rect
+    print("✓ Downscaled template covers its source size")
+
+    assert from_file.pixmap().size() == QSize(997, 598)
+    assert from_file.mapRectToScene(QRectF(from_file.pixmap().rect())) == rect
+    print("✓ Template decoding its own file gets the same size")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("TEMPLATE IMAGE TESTS")
+    print("=" * 60)
+    print()
+
+    try:
+        test_read_small_image()
+        test_read_large_image()
+        test_read_missing_image()
+        test_item_keeps_source_size()
+
+        print()
+        print("=" * 60)
+        print("✅ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+    except Exception as e:
+        print()
+        print("=" * 60)
+        print(f"❌ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())